@@ -4,83 +4,81 @@ An automation wrapper for Ansible that eliminates redundant tasks by analyzing
 Git diffs and executing only the minimum required operations.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
-from said.dag_builder import CycleDetectedError, DAGError, DependencyGraph
-from said.git_detector import GitDetector, GitDetectorError
-from said.matcher import (
-    get_tasks_for_changed_files,
-    match_file_to_tasks,
-    match_files_to_tasks,
-)
-from said.parser import (
-    ParserError,
-    clear_dependency_map_cache,
-    discover_dependency_map,
-    parse_dependency_map,
-    parse_inline_metadata,
-    parse_playbook_directory,
-    parse_yaml_file,
-)
-from said.resolver import (
-    DependencyResolver,
-    ResolverError,
-    resolve_dependencies,
-)
-from said.schema import (
-    DependencyMap,
-    SchemaError,
-    TaskMetadata,
-    validate_dependency_map,
-    validate_task_metadata,
-)
-from said.state_store import FileStateStore, StateStore, StateStoreError
-from said.validator import (
-    MissingVariableError,
-    ValidationError,
-    VariableValidator,
-    check_variables_required,
-    validate_variables,
-)
-from said.orchestrator import AnsibleOrchestrator, OrchestratorError
-from said.coordinator import CoordinatorError, WorkflowCoordinator
-from said.builder import (
-    BuilderError,
-    analyze_ansible_playbook,
-    analyze_ansible_task,
-    build_dependency_map_from_directory,
-    build_dependency_map_from_playbooks,
-    find_role_path,
-    resolve_playbook_path,
-)
-from said.inventory_loader import (
-    InventoryLoaderError,
-    discover_group_vars,
-    discover_host_vars,
-    load_all_variables,
-    load_group_vars,
-    load_host_vars,
-    load_inventory_variables,
-)
-from said.error_collector import (
-    DependencyError,
-    DependencyErrorCollector,
-    DependencyErrorReport,
-    validate_dependency_map_comprehensive,
-)
-from said.variable_searcher import (
-    find_all_variable_suggestions,
-    find_variable_suggestions,
-    search_variable_in_text_file,
-    search_variable_in_yaml_file,
-)
-from said.variable_dependency_analyzer import (
-    VariableProducer,
-    analyze_variable_dependencies_comprehensive,
-    build_producers_dictionary,
-    map_variable_dependencies_to_tasks,
-)
-from said.error_parser import parse_dependency_error, structure_dependency_error
+# Public names are imported lazily on first access so that lightweight entry
+# points (e.g. `said --help`) do not pay for GitPython, PyYAML, etc. at startup.
+_LAZY_IMPORTS = {
+    "CycleDetectedError": "said.dag_builder",
+    "DAGError": "said.dag_builder",
+    "DependencyGraph": "said.dag_builder",
+    "find_cycle_paths": "said.dag_builder",
+    "find_scc_cycles": "said.dag_builder",
+    "GitDetector": "said.git_detector",
+    "GitDetectorError": "said.git_detector",
+    "get_tasks_for_changed_files": "said.matcher",
+    "match_file_to_tasks": "said.matcher",
+    "match_files_to_tasks": "said.matcher",
+    "ParserError": "said.parser",
+    "clear_dependency_map_cache": "said.parser",
+    "discover_dependency_map": "said.parser",
+    "parse_dependency_map": "said.parser",
+    "parse_inline_metadata": "said.parser",
+    "parse_playbook_directory": "said.parser",
+    "parse_yaml_file": "said.parser",
+    "DependencyResolver": "said.resolver",
+    "ResolverError": "said.resolver",
+    "resolve_dependencies": "said.resolver",
+    "DependencyMap": "said.schema",
+    "SchemaError": "said.schema",
+    "TaskMetadata": "said.schema",
+    "validate_dependency_map": "said.schema",
+    "validate_task_metadata": "said.schema",
+    "FileStateStore": "said.state_store",
+    "StateStore": "said.state_store",
+    "StateStoreError": "said.state_store",
+    "MissingVariableError": "said.validator",
+    "ValidationError": "said.validator",
+    "VariableValidator": "said.validator",
+    "check_variables_required": "said.validator",
+    "validate_variables": "said.validator",
+    "AnsibleOrchestrator": "said.orchestrator",
+    "OrchestratorError": "said.orchestrator",
+    "CoordinatorError": "said.coordinator",
+    "WorkflowCoordinator": "said.coordinator",
+    "BuilderError": "said.builder",
+    "analyze_ansible_playbook": "said.builder",
+    "analyze_ansible_task": "said.builder",
+    "build_dependency_map_from_directory": "said.builder",
+    "build_dependency_map_from_playbooks": "said.builder",
+    "find_role_path": "said.builder",
+    "resolve_playbook_path": "said.builder",
+    "InventoryLoaderError": "said.inventory_loader",
+    "discover_group_vars": "said.inventory_loader",
+    "discover_host_vars": "said.inventory_loader",
+    "load_all_variables": "said.inventory_loader",
+    "load_group_vars": "said.inventory_loader",
+    "load_host_vars": "said.inventory_loader",
+    "load_inventory_variables": "said.inventory_loader",
+    "DependencyError": "said.error_collector",
+    "DependencyErrorCollector": "said.error_collector",
+    "DependencyErrorReport": "said.error_collector",
+    "iter_validation_errors": "said.error_collector",
+    "validate_dependency_map_comprehensive": "said.error_collector",
+    "find_all_variable_suggestions": "said.variable_searcher",
+    "find_variable_suggestions": "said.variable_searcher",
+    "search_variable_in_text_file": "said.variable_searcher",
+    "search_variable_in_yaml_file": "said.variable_searcher",
+    "VariableProducer": "said.variable_dependency_analyzer",
+    "analyze_variable_dependencies_comprehensive": "said.variable_dependency_analyzer",
+    "build_producers_dictionary": "said.variable_dependency_analyzer",
+    "map_variable_dependencies_to_tasks": "said.variable_dependency_analyzer",
+    "parse_dependency_error": "said.error_parser",
+    "parse_dependency_errors_bulk": "said.error_parser",
+    "structure_dependency_error": "said.error_parser",
+}
 
 __all__ = [
     "__version__",
@@ -107,6 +105,8 @@ __all__ = [
     "clear_dependency_map_cache",
     # DAG builder
     "DependencyGraph",
+    "find_cycle_paths",
+    "find_scc_cycles",
     "DAGError",
     "CycleDetectedError",
     # Matcher
@@ -149,6 +149,7 @@ __all__ = [
     "DependencyError",
     "DependencyErrorCollector",
     "DependencyErrorReport",
+    "iter_validation_errors",
     "validate_dependency_map_comprehensive",
     # Variable Searcher
     "find_variable_suggestions",
@@ -162,5 +163,21 @@ __all__ = [
     "analyze_variable_dependencies_comprehensive",
     # Error Parser
     "parse_dependency_error",
+    "parse_dependency_errors_bulk",
     "structure_dependency_error",
 ]
+
+
+def __getattr__(name):
+    """Import public names from their submodules on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported public names in dir(said)."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,12 +1,27 @@
 """Command-line interface for SAID."""
 
+import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
 
-from said.coordinator import CoordinatorError, WorkflowCoordinator
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+if orjson is not None:
+    # Match the stdlib encoder: stringify non-str keys, and leave dataclasses
+    # and datetimes unencoded so they fail the same way they do in json.dumps
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
 
 
 def echo_if_not_json(message: str, json_mode: bool = False, **kwargs):
@@ -19,11 +34,6 @@ def echo_if_not_json(message: str, json_mode: bool = False, **kwargs):
     """
     if not json_mode:
         click.echo(message, **kwargs)
-from said.inventory_loader import (
-    load_all_variables,
-    load_group_vars,
-    load_host_vars,
-)
 
 
 @click.group()
@@ -37,6 +47,44 @@ def cli():
     pass
 
 
+def _dumps_json(obj) -> str:
+    """Serialize an object as JSON indented by two spaces.
+
+    The result matches json.dumps(obj, indent=2), except that floats may be
+    written in another equivalent form. orjson is used when it is installed
+    and can produce that document; otherwise the stdlib encoder is used.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        JSON string.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            encoded = None
+        # orjson writes non-ASCII characters as-is, the stdlib escapes them
+        if encoded is not None and encoded.isascii():
+            return encoded.decode()
+    return json.dumps(obj, indent=2)
+
+
+def _echo_report(error_report) -> None:
+    """Write a DependencyErrorReport to stdout as JSON, followed by a newline.
+
+    The report is streamed one error at a time, so large reports are never
+    held in memory as a single string.
+
+    Args:
+        error_report: The DependencyErrorReport to write.
+    """
+    error_report.write_json(sys.stdout)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
 def _find_roles_directory(playbook_path: Path, inventory_path: Optional[Path] = None) -> Optional[Path]:
     """Find the roles directory relative to playbook or inventory.
     
@@ -78,6 +126,22 @@ def _find_roles_directory(playbook_path: Path, inventory_path: Optional[Path] =
     return None
 
 
+def _load_vars_quietly(loader, path: Path) -> dict:
+    """Load a vars file or directory, returning an empty dict on failure.
+
+    Args:
+        loader: Loader function (load_group_vars or load_host_vars).
+        path: Path to pass to the loader.
+
+    Returns:
+        Dictionary of loaded variables, or an empty dict if loading failed.
+    """
+    try:
+        return loader(path)
+    except Exception:
+        return {}
+
+
 def _is_task_file(file_path: Path) -> bool:
     """Check if a file path is a role task file (not a playbook).
     
@@ -179,6 +243,11 @@ def _is_task_file(file_path: Path) -> bool:
     is_flag=True,
     help="Output validation errors in JSON format (only if validation fails).",
 )
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    help="With --json-errors, stop collecting validation errors after this many.",
+)
 def analyze(
     dependency_map: Optional[Path],
     from_commit: Optional[str],
@@ -190,18 +259,24 @@ def analyze(
     no_validate: bool,
     output_json: bool,
     json_errors: bool,
+    max_errors: Optional[int],
 ):
     """Analyze changes and generate execution plan without executing.
 
     This command shows what would be executed based on the current git state
     and dependency map, but does not run Ansible.
     """
+    # Convert click paths to strings once for the coordinator and error details
+    repo_str = str(repo_path) if repo_path else None
+    dependency_map_str = str(dependency_map) if dependency_map else None
+    playbook_str = str(playbook)
+    inventory_str = str(inventory) if inventory else None
+
     # Validate that playbook is not a task file
     if _is_task_file(playbook):
         # Try to extract role name for better error message
         role_name = None
-        playbook_path = Path(playbook).resolve()
-        parts = playbook_path.parts
+        parts = playbook.resolve().parts
         if "roles" in parts:
             roles_idx = parts.index("roles")
             if roles_idx + 1 < len(parts):
@@ -227,7 +302,7 @@ def analyze(
                         task_name="analyze",
                         message=error_msg,
                         details={
-                            "file_path": str(playbook),
+                            "file_path": playbook_str,
                             "role_name": role_name,
                             "suggestion": "Use a playbook file that includes this role instead of the task file directly.",
                         },
@@ -236,17 +311,19 @@ def analyze(
                 total_errors=1,
                 error_summary={"invalid_playbook": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(error_msg, err=True)
         sys.exit(1)
     
+    from said.coordinator import CoordinatorError, WorkflowCoordinator
+
     try:
         coordinator = WorkflowCoordinator(
-            repo_path=str(repo_path) if repo_path else None,
-            dependency_map_path=str(dependency_map) if dependency_map else None,
-            playbook_path=str(playbook),
-            inventory=str(inventory) if inventory else None,
+            repo_path=repo_str,
+            dependency_map_path=dependency_map_str,
+            playbook_path=playbook_str,
+            inventory=inventory_str,
         )
 
         result = coordinator.run_full_workflow(
@@ -256,22 +333,29 @@ def analyze(
             validate_vars=not no_validate,
             dry_run=True,
             collect_all_errors=json_errors,
+            max_errors=max_errors,
         )
 
+        # Nothing changed and nothing to run: skip all formatting below
+        if not output_json and not (result["changed_files"] or result["execution_order"]):
+            if not json_errors:
+                click.echo("No changes.")
+            return
+
+        matched_sorted = sorted(result["matched_tasks"])
+
         # Check for validation errors
         if "validation_errors" in result and result["validation_errors"]:
             if json_errors or output_json:
-                import json
-
                 error_output = {
                     "validation_errors": result["validation_errors"],
                     "workflow_result": {
                         "changed_files": result["changed_files"],
-                        "matched_tasks": list(result["matched_tasks"]),
+                        "matched_tasks": matched_sorted,
                         "execution_order": result["execution_order"],
                     },
                 }
-                click.echo(json.dumps(error_output, indent=2))
+                click.echo(_dumps_json(error_output))
                 sys.exit(1)
             else:
                 from said.error_collector import DependencyErrorReport
@@ -298,8 +382,6 @@ def analyze(
                 sys.exit(1)
 
         if output_json:
-            import json
-
             # Use orchestrator's JSON formatter for consistent output
             orchestrator = coordinator.orchestrator
             if orchestrator:
@@ -314,12 +396,12 @@ def analyze(
                 # Fallback to basic format
                 output = {
                     "changed_files": result["changed_files"],
-                    "matched_tasks": list(result["matched_tasks"]),
+                    "matched_tasks": matched_sorted,
                     "execution_order": result["execution_order"],
                     "command": result["command"],
                     "command_string": result["command_string"],
                 }
-            click.echo(json.dumps(output, indent=2))
+            click.echo(_dumps_json(output))
         else:
             # Human-readable output (suppressed if json_errors is enabled)
             if not json_errors:
@@ -328,9 +410,9 @@ def analyze(
                     for file_path in result["changed_files"]:
                         click.echo(f"  - {file_path}")
 
-                if result["matched_tasks"]:
-                    click.echo(f"\nMatched Tasks ({len(result['matched_tasks'])}):")
-                    for task_name in sorted(result["matched_tasks"]):
+                if matched_sorted:
+                    click.echo(f"\nMatched Tasks ({len(matched_sorted)}):")
+                    for task_name in matched_sorted:
                         click.echo(f"  - {task_name}")
 
                 if result["execution_order"]:
@@ -345,7 +427,6 @@ def analyze(
 
     except CoordinatorError as e:
         if json_errors or output_json:
-            import json
             from said.error_collector import DependencyError, DependencyErrorReport
             
             error_report = DependencyErrorReport(
@@ -360,13 +441,12 @@ def analyze(
                 total_errors=1,
                 error_summary={"coordinator_error": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     except Exception as e:
         if json_errors or output_json:
-            import json
             from said.error_collector import DependencyError, DependencyErrorReport
             import traceback
             
@@ -385,7 +465,7 @@ def analyze(
                 total_errors=1,
                 error_summary={"unexpected_error": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(f"Unexpected error: {e}", err=True)
         sys.exit(1)
@@ -467,6 +547,11 @@ def analyze(
     is_flag=True,
     help="Output validation errors in JSON format (only if validation fails).",
 )
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    help="With --json-errors, stop collecting validation errors after this many.",
+)
 def execute(
     dependency_map: Optional[Path],
     from_commit: Optional[str],
@@ -481,6 +566,7 @@ def execute(
     environment: str,
     no_state_update: bool,
     json_errors: bool,
+    max_errors: Optional[int],
 ):
     """Execute Ansible tasks based on git changes.
 
@@ -488,12 +574,17 @@ def execute(
     the generated Ansible command. After successful execution, updates the
     state store with the current commit.
     """
+    # Convert click paths to strings once for the coordinator and error details
+    repo_str = str(repo_path) if repo_path else None
+    dependency_map_str = str(dependency_map) if dependency_map else None
+    playbook_str = str(playbook)
+    inventory_str = str(inventory) if inventory else None
+
     # Validate that playbook is not a task file
     if _is_task_file(playbook):
         # Try to extract role name for better error message
         role_name = None
-        playbook_path = Path(playbook).resolve()
-        parts = playbook_path.parts
+        parts = playbook.resolve().parts
         if "roles" in parts:
             roles_idx = parts.index("roles")
             if roles_idx + 1 < len(parts):
@@ -519,7 +610,7 @@ def execute(
                         task_name="execute",
                         message=error_msg,
                         details={
-                            "file_path": str(playbook),
+                            "file_path": playbook_str,
                             "role_name": role_name,
                             "suggestion": "Use a playbook file that includes this role instead of the task file directly.",
                         },
@@ -528,17 +619,19 @@ def execute(
                 total_errors=1,
                 error_summary={"invalid_playbook": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(error_msg, err=True)
         sys.exit(1)
     
+    from said.coordinator import CoordinatorError, WorkflowCoordinator
+
     try:
         coordinator = WorkflowCoordinator(
-            repo_path=str(repo_path) if repo_path else None,
-            dependency_map_path=str(dependency_map) if dependency_map else None,
-            playbook_path=str(playbook),
-            inventory=str(inventory) if inventory else None,
+            repo_path=repo_str,
+            dependency_map_path=dependency_map_str,
+            playbook_path=playbook_str,
+            inventory=inventory_str,
         )
 
         # Run workflow
@@ -550,13 +643,14 @@ def execute(
             dry_run=dry_run,
             full_deploy=full_deploy,
             collect_all_errors=json_errors,
+            # The command is only displayed when not emitting JSON errors
+            include_command_string=not json_errors,
+            max_errors=max_errors,
         )
 
         # Check for validation errors
         if "validation_errors" in result and result["validation_errors"]:
             if json_errors:
-                import json
-
                 error_output = {
                     "validation_errors": result["validation_errors"],
                     "workflow_result": {
@@ -638,7 +732,6 @@ def execute(
 
         # Execute command
         import subprocess
-        import os
 
         if not json_errors:
             click.echo("\nExecuting Ansible command...")
@@ -659,6 +752,16 @@ def execute(
                 click.echo(f"Using roles directory: {roles_dir}")
         
         try:
+            if no_state_update and os.name != "nt":
+                # Nothing to do after Ansible finishes, so replace this process
+                # instead of forking a child and waiting on it. The state update
+                # path below needs the exit code and must keep using subprocess,
+                # as must Windows, where exec starts a new process and the
+                # caller would not see Ansible's exit code.
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os.execvpe(result["command"][0], result["command"], env)
+
             exit_code = subprocess.run(
                 result["command"],
                 check=False,
@@ -682,7 +785,6 @@ def execute(
 
         except KeyboardInterrupt:
             if json_errors:
-                import json
                 from said.error_collector import DependencyError, DependencyErrorReport
                 
                 error_report = DependencyErrorReport(
@@ -697,13 +799,12 @@ def execute(
                     total_errors=1,
                     error_summary={"execution_interrupted": 1},
                 )
-                click.echo(error_report.to_json())
+                _echo_report(error_report)
             else:
                 click.echo("\n\nExecution interrupted by user.", err=True)
             sys.exit(130)
         except Exception as e:
             if json_errors:
-                import json
                 from said.error_collector import DependencyError, DependencyErrorReport
                 import traceback
                 
@@ -722,14 +823,13 @@ def execute(
                     total_errors=1,
                     error_summary={"execution_error": 1},
                 )
-                click.echo(error_report.to_json())
+                _echo_report(error_report)
             else:
                 click.echo(f"\n✗ Error executing command: {e}", err=True)
             sys.exit(1)
 
     except CoordinatorError as e:
         if json_errors:
-            import json
             from said.error_collector import DependencyError, DependencyErrorReport
             
             error_report = DependencyErrorReport(
@@ -744,13 +844,12 @@ def execute(
                 total_errors=1,
                 error_summary={"coordinator_error": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     except Exception as e:
         if json_errors:
-            import json
             from said.error_collector import DependencyError, DependencyErrorReport
             import traceback
             
@@ -769,7 +868,7 @@ def execute(
                 total_errors=1,
                 error_summary={"unexpected_error": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(f"Unexpected error: {e}", err=True)
         sys.exit(1)
@@ -800,11 +899,17 @@ def execute(
     is_flag=True,
     help="Output errors in JSON format.",
 )
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    help="Stop collecting validation errors after this many.",
+)
 def validate(
     dependency_map: Optional[Path],
     inventory: Optional[Path],
     variables: Optional[str],
     output_json: bool,
+    max_errors: Optional[int],
 ):
     """Validate dependency map and required variables.
 
@@ -824,7 +929,6 @@ def validate(
             dep_map = discover_dependency_map()
             if dep_map is None:
                 if output_json:
-                    import json
                     from said.error_collector import DependencyError, DependencyErrorReport
                     
                     error_report = DependencyErrorReport(
@@ -839,7 +943,7 @@ def validate(
                         total_errors=1,
                         error_summary={"file_not_found": 1},
                     )
-                    click.echo(error_report.to_json())
+                    _echo_report(error_report)
                 else:
                     click.echo("Error: Could not find dependency_map.yml", err=True)
                 sys.exit(1)
@@ -866,7 +970,6 @@ def validate(
                     vars_dict.update(yaml.safe_load(f) or {})
             except Exception as e:
                 if output_json:
-                    import json
                     from said.error_collector import DependencyError, DependencyErrorReport
                     
                     error_report = DependencyErrorReport(
@@ -881,7 +984,7 @@ def validate(
                         total_errors=1,
                         error_summary={"file_error": 1},
                     )
-                    click.echo(error_report.to_json())
+                    _echo_report(error_report)
                 else:
                     click.echo(f"Error loading variables file: {e}", err=True)
                 sys.exit(1)
@@ -894,24 +997,22 @@ def validate(
         if dependency_map:
             search_base = dependency_map.parent
         else:
-            # Try to find dependency map location
-            from said.parser import discover_dependency_map
-            discovered_map = discover_dependency_map()
-            if discovered_map:
-                # Use current directory as search base
-                search_base = Path.cwd()
+            # The map was auto-discovered above (we exit if it wasn't), so reuse
+            # that result instead of walking the search paths a second time
+            search_base = Path.cwd()
 
         error_report = validate_dependency_map_comprehensive(
             dep_map,
-            task_names=set(task.name for task in dep_map.tasks),
+            task_names=dep_map.task_names,
             variables=vars_dict if vars_dict else None,
             search_base=search_base,
             search_for_suggestions=True,
+            max_errors=max_errors,
         )
 
         if error_report.has_errors():
             if output_json:
-                click.echo(error_report.to_json())
+                _echo_report(error_report)
                 sys.exit(1)
             else:
                 click.echo("\n✗ Dependency validation failed:")
@@ -991,7 +1092,6 @@ def validate(
 
     except Exception as e:
         if output_json:
-            import json
             from said.error_collector import DependencyError, DependencyErrorReport
             import traceback
             
@@ -1010,7 +1110,7 @@ def validate(
                 total_errors=1,
                 error_summary={"validation_error": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -1111,6 +1211,11 @@ def build(
             build_dependency_map_from_directory,
             build_dependency_map_from_playbooks,
         )
+        from said.inventory_loader import (
+            load_all_variables,
+            load_group_vars,
+            load_host_vars,
+        )
 
         # Convert tuple to list (click's multiple=True returns a tuple)
         playbook_paths = list(playbook) if playbook and len(playbook) > 0 else []
@@ -1123,12 +1228,9 @@ def build(
             if verbose and not json_errors:
                 click.echo("Loading variables from inventory and vars files...")
             
-            # Determine inventory directory for auto-discovery
-            inventory_dir = None
-            if inventory:
-                inventory_dir = Path(inventory).parent
-                if verbose and not json_errors:
-                    click.echo(f"  Inventory: {inventory}")
+            # load_all_variables derives the inventory directory for auto-discovery
+            if inventory and verbose and not json_errors:
+                click.echo(f"  Inventory: {inventory}")
 
             # Load from explicit paths
             for gv_path in group_vars_paths:
@@ -1145,17 +1247,14 @@ def build(
                     host_vars_path=host_vars_paths[0] if host_vars_paths else None,
                     auto_discover=not no_auto_discover_vars,
                 )
-                # Merge multiple group_vars/host_vars if provided
+                # Merge multiple group_vars/host_vars if provided, in input order.
+                # Paths are loaded one at a time: a large vars directory is
+                # already parsed in a process pool, which must not be forked
+                # from a multithreaded process.
                 for gv_path in group_vars_paths[1:]:
-                    try:
-                        known_variables.update(load_group_vars(gv_path))
-                    except Exception:
-                        pass
+                    known_variables.update(_load_vars_quietly(load_group_vars, gv_path))
                 for hv_path in host_vars_paths[1:]:
-                    try:
-                        known_variables.update(load_host_vars(hv_path))
-                    except Exception:
-                        pass
+                    known_variables.update(_load_vars_quietly(load_host_vars, hv_path))
                 
                 if verbose and not json_errors:
                     click.echo(f"  Loaded {len(known_variables)} known variables")
@@ -1167,7 +1266,6 @@ def build(
         if output.exists() and not overwrite:
             if json_errors:
                 # In JSON mode, don't prompt - just error
-                import json
                 from said.error_collector import DependencyError, DependencyErrorReport
                 
                 error_report = DependencyErrorReport(
@@ -1182,7 +1280,7 @@ def build(
                     total_errors=1,
                     error_summary={"file_exists": 1},
                 )
-                click.echo(error_report.to_json())
+                _echo_report(error_report)
                 sys.exit(1)
             else:
                 if not click.confirm(
@@ -1214,7 +1312,6 @@ def build(
             )
         else:
             if json_errors:
-                import json
                 from said.error_collector import DependencyError, DependencyErrorReport
                 
                 error_report = DependencyErrorReport(
@@ -1229,7 +1326,7 @@ def build(
                     total_errors=1,
                     error_summary={"build_error": 1},
                 )
-                click.echo(error_report.to_json())
+                _echo_report(error_report)
             else:
                 click.echo(
                     "Error: Must specify either --directory or --playbook",
@@ -1249,7 +1346,6 @@ def build(
 
     except BuilderError as e:
         if json_errors:
-            import json
             from said.error_collector import DependencyError, DependencyErrorReport
             from said.error_parser import structure_dependency_error
             
@@ -1261,9 +1357,9 @@ def build(
             # Determine search base
             search_base = None
             if playbook_paths:
-                search_base = Path(playbook_paths[0]).parent
+                search_base = playbook_paths[0].parent
             elif directory:
-                search_base = Path(directory)
+                search_base = directory
             
             # Try to parse and structure the error with variable analysis
             structured = structure_dependency_error(
@@ -1302,13 +1398,12 @@ def build(
                     total_errors=1,
                     error_summary={"builder_error": 1},
                 )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     except Exception as e:
         if json_errors:
-            import json
             from said.error_collector import DependencyError, DependencyErrorReport
             import traceback
             
@@ -1327,7 +1422,7 @@ def build(
                 total_errors=1,
                 error_summary={"unexpected_error": 1},
             )
-            click.echo(error_report.to_json())
+            _echo_report(error_report)
         else:
             click.echo(f"Unexpected error: {e}", err=True)
             import traceback
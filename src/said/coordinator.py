@@ -9,24 +9,29 @@ This module orchestrates the complete workflow:
 6. Generate Ansible command
 """
 
+import itertools
 import logging
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 from said.git_detector import GitDetector, GitDetectorError
 from said.matcher import get_tasks_for_changed_files
-from said.orchestrator import AnsibleOrchestrator, OrchestratorError
 from said.parser import ParserError, discover_dependency_map, parse_dependency_map
-from said.resolver import DependencyResolver, ResolverError
 from said.schema import DependencyMap
-from said.state_store import FileStateStore, StateStore, StateStoreError
 from said.validator import (
     MissingVariableError,
-    VariableValidator,
     ValidationError,
     check_variables_required,
 )
 
+if TYPE_CHECKING:
+    # Resolver, orchestrator and state store are imported where they are
+    # first used, so importing the coordinator stays cheap.
+    from said.orchestrator import AnsibleOrchestrator
+    from said.resolver import DependencyResolver
+    from said.state_store import StateStore
+
 
 class CoordinatorError(Exception):
     """Base exception for coordinator errors."""
@@ -34,14 +39,53 @@ class CoordinatorError(Exception):
     pass
 
 
+def _zero_directory_variants(pattern: str) -> List[str]:
+    """Expand a glob pattern into the pathspecs its "**/" segments can stand for.
+
+    Each "**/" may match zero directories (as in the matcher) or one or more
+    (as "**/" does in a pathspec), so every combination of dropping and
+    keeping them is listed.
+
+    Args:
+        pattern: The normalized glob pattern.
+
+    Returns:
+        The pattern itself, followed by its variants if it contains "**/".
+    """
+    parts = pattern.split("**/")
+    if len(parts) == 1:
+        return [pattern]
+
+    variants = []
+    for separators in itertools.product(("**/", ""), repeat=len(parts) - 1):
+        variant = parts[0]
+        for separator, part in zip(separators, parts[1:]):
+            variant += separator + part
+        variants.append(variant)
+    return variants
+
+
 class WorkflowCoordinator:
     """Coordinates the complete SAID workflow."""
 
+    # Path prefixes that mark a change to SAID itself
+    _SAID_PREFIXES = ("src/said/", "said/", ".said/")
+
+    # All safety sentinels in one automaton: a SAID path prefix, or any path
+    # mentioning a dependency map file (this also covers the ansible/ and
+    # playbooks/ locations checked by auto-discovery). The prefix branch is
+    # tried first at position 0, so the matched group tells which check hit.
+    _SAFETY_RE = re.compile(
+        "(?P<said>^(?:"
+        + "|".join(re.escape(prefix) for prefix in _SAID_PREFIXES)
+        + r"))|(?P<depmap>dependency_map\.ya?ml)"
+    )
+
     def __init__(
         self,
         repo_path: Optional[str] = None,
         dependency_map_path: Optional[str] = None,
-        state_store: Optional[StateStore] = None,
+        state_store: Optional["StateStore"] = None,
         playbook_path: str = "playbook.yml",
         inventory: Optional[str] = None,
         variables: Optional[Dict[str, any]] = None,
@@ -86,14 +130,23 @@ class WorkflowCoordinator:
 
         # Initialize state store
         if state_store is None:
+            from said.state_store import FileStateStore
+
             self.state_store = FileStateStore()
         else:
             self.state_store = state_store
 
+        # Git pathspecs covering every watched file, built with the map
+        self._pathspecs: Optional[List[str]] = None
+
+        # Last successful commit per environment, read from the state store
+        # at most once per coordinator (see refresh())
+        self._cached_last_commit: Dict[str, Optional[str]] = {}
+
         # Will be initialized when dependency map is loaded
         self.dependency_map: Optional[DependencyMap] = None
-        self.resolver: Optional[DependencyResolver] = None
-        self.orchestrator: Optional[AnsibleOrchestrator] = None
+        self.resolver: Optional["DependencyResolver"] = None
+        self.orchestrator: Optional["AnsibleOrchestrator"] = None
 
     def load_dependency_map(self) -> DependencyMap:
         """Load the dependency map from file or auto-discover it.
@@ -119,7 +172,12 @@ class WorkflowCoordinator:
                     )
                 self.logger.info("Auto-discovered dependency map")
 
+            self._pathspecs = self._build_pathspecs(self.dependency_map)
+
             # Initialize resolver and orchestrator
+            from said.orchestrator import AnsibleOrchestrator
+            from said.resolver import DependencyResolver
+
             self.resolver = DependencyResolver(self.dependency_map)
             self.orchestrator = AnsibleOrchestrator(
                 playbook_path=self.playbook_path,
@@ -133,6 +191,47 @@ class WorkflowCoordinator:
         except Exception as e:
             raise CoordinatorError(f"Unexpected error loading dependency map: {e}")
 
+    # Beyond this many pathspecs the git command line gets unwieldy, and the
+    # diff is left unfiltered instead
+    _MAX_PATHSPECS = 1000
+
+    def _build_pathspecs(self, dependency_map: DependencyMap) -> Optional[List[str]]:
+        """Build git pathspecs covering every file a task or safety check cares about.
+
+        Git's default pathspec wildcards let ``*`` match ``/``, as fnmatch does in
+        the matcher. Each pattern is therefore emitted both anchored at the
+        repository root and behind ``*/``, which catches the matcher's filename and
+        path-suffix matches. In a pathspec ``**/`` still needs its ``/``, while
+        the matcher lets it match zero directories, so patterns containing it
+        are also emitted with every combination of those segments removed. The
+        result may include extra files but never drops one the matcher or
+        check_safety_conditions would act on.
+
+        Args:
+            dependency_map: The loaded dependency map.
+
+        Returns:
+            List of pathspecs, or None if the diff should not be filtered.
+        """
+        patterns = {
+            *self._SAID_PREFIXES,
+            "*dependency_map.yml*",
+            "*dependency_map.yaml*",
+        }
+        for task in dependency_map.tasks:
+            for pattern in task.watch_files:
+                if pattern and pattern.strip():
+                    for variant in _zero_directory_variants(Path(pattern).as_posix()):
+                        patterns.add(variant)
+                        patterns.add(f"*/{variant}")
+
+        if len(patterns) > self._MAX_PATHSPECS:
+            return None
+
+        # ":(top)" anchors at the repository root and stops a leading ":" in a
+        # pattern from being read as pathspec magic
+        return [f":(top){pattern}" for pattern in sorted(patterns)]
+
     def check_safety_conditions(
         self, changed_files: List[str], force_full_deploy: bool = False
     ) -> bool:
@@ -153,36 +252,27 @@ class WorkflowCoordinator:
         if force_full_deploy:
             return True
 
-        # Check if SAID code changed
-        said_paths = [
-            "src/said/",
-            "said/",
-            ".said/",
-        ]
-        for file_path in changed_files:
-            for said_path in said_paths:
-                if file_path.startswith(said_path):
-                    self.logger.warning(
-                        f"SAID code changed ({file_path}) - forcing full deploy for safety"
-                    )
-                    return True
-
-        # Check if dependency_map.yml changed
-        dependency_map_files = [
-            "dependency_map.yml",
-            "dependency_map.yaml",
-            "ansible/dependency_map.yml",
-            "playbooks/dependency_map.yml",
-        ]
+        # Scan each path once for every sentinel. A SAID code change wins
+        # over a dependency map change, so the latter is only remembered.
+        safety_search = self._SAFETY_RE.search
+        dependency_map_change = None
         for file_path in changed_files:
-            if any(
-                file_path.endswith(dep_file) or dep_file in file_path
-                for dep_file in dependency_map_files
-            ):
+            match = safety_search(file_path)
+            if match is None:
+                continue
+            if match.lastgroup == "said":
                 self.logger.warning(
-                    f"Dependency map changed ({file_path}) - forcing full deploy for safety"
+                    f"SAID code changed ({file_path}) - forcing full deploy for safety"
                 )
                 return True
+            if dependency_map_change is None:
+                dependency_map_change = file_path
+
+        if dependency_map_change is not None:
+            self.logger.warning(
+                f"Dependency map changed ({dependency_map_change}) - forcing full deploy for safety"
+            )
+            return True
 
         # Check if git repository is dirty
         try:
@@ -197,6 +287,28 @@ class WorkflowCoordinator:
 
         return False
 
+    def get_last_successful_commit(self, environment: str = "default") -> Optional[str]:
+        """Get the last successful commit, reading the state store only once.
+
+        Args:
+            environment: Environment name. Defaults to "default".
+
+        Returns:
+            The last successful commit SHA, or None if there is none.
+        """
+        if environment not in self._cached_last_commit:
+            self._cached_last_commit[environment] = (
+                self.state_store.get_last_successful_commit(environment)
+            )
+        return self._cached_last_commit[environment]
+
+    def refresh(self) -> None:
+        """Forget cached state store values so the next read hits the store.
+
+        Call this if the state store may have been changed by another process.
+        """
+        self._cached_last_commit.clear()
+
     def get_changed_files(
         self,
         from_commit: Optional[str] = None,
@@ -220,7 +332,7 @@ class WorkflowCoordinator:
         try:
             # Determine from_commit
             if from_commit is None and use_state_store:
-                from_commit = self.state_store.get_last_successful_commit()
+                from_commit = self.get_last_successful_commit()
                 if from_commit:
                     self.logger.info(
                         f"Using last successful commit: {from_commit[:8]}..."
@@ -237,9 +349,15 @@ class WorkflowCoordinator:
                     "Please specify --from-commit or ensure state store has a previous commit."
                 )
 
-            changed_files = self.git_detector.get_changed_files(
-                from_commit, to_commit
-            )
+            if self._pathspecs:
+                # Let git drop files no task watches before they reach Python
+                changed_files = self.git_detector.get_changed_files(
+                    from_commit, to_commit, pathspecs=self._pathspecs
+                )
+            else:
+                changed_files = self.git_detector.get_changed_files(
+                    from_commit, to_commit
+                )
             self.logger.info(f"Found {len(changed_files)} changed files")
             return changed_files
 
@@ -267,9 +385,12 @@ class WorkflowCoordinator:
             matched_tasks = get_tasks_for_changed_files(
                 changed_files, self.dependency_map
             )
-            self.logger.info(
-                f"Matched {len(matched_tasks)} tasks: {', '.join(sorted(matched_tasks))}"
-            )
+            # Sorting and joining every task name is only worth it if the
+            # message will actually be emitted
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Matched {len(matched_tasks)} tasks: {', '.join(sorted(matched_tasks))}"
+                )
             return matched_tasks
 
         except Exception as e:
@@ -295,6 +416,8 @@ class WorkflowCoordinator:
                 "Resolver not initialized. Call load_dependency_map() first."
             )
 
+        from said.resolver import ResolverError
+
         try:
             execution_order = self.resolver.resolve(
                 matched_tasks, include_triggers=include_triggers
@@ -308,13 +431,18 @@ class WorkflowCoordinator:
             raise CoordinatorError(f"Failed to resolve dependencies: {e}")
 
     def validate_variables(
-        self, task_names: Set[str], collect_all_errors: bool = False
+        self,
+        task_names: Set[str],
+        collect_all_errors: bool = False,
+        max_errors: Optional[int] = None,
     ) -> Optional[Dict]:
         """Validate that all required variables are present.
 
         Args:
             task_names: Set of task names to validate.
             collect_all_errors: If True, collect all errors and return error report instead of raising.
+            max_errors: Optional cap on the number of errors collected when
+                collect_all_errors is True; later validation stages are skipped.
 
         Returns:
             If collect_all_errors is True, returns error report dict. Otherwise None.
@@ -329,7 +457,6 @@ class WorkflowCoordinator:
 
         if collect_all_errors:
             from said.error_collector import validate_dependency_map_comprehensive
-            from pathlib import Path
 
             # Use playbook directory as search base if available
             search_base = None
@@ -342,6 +469,7 @@ class WorkflowCoordinator:
                 variables=self.variables,
                 search_base=search_base,
                 search_for_suggestions=True,
+                max_errors=max_errors,
             )
             if error_report.has_errors():
                 return error_report.to_dict()
@@ -382,6 +510,8 @@ class WorkflowCoordinator:
                 "Orchestrator not initialized. Call load_dependency_map() first."
             )
 
+        from said.orchestrator import OrchestratorError
+
         try:
             return self.orchestrator.generate_command(task_names, dry_run=dry_run)
         except OrchestratorError as e:
@@ -396,6 +526,8 @@ class WorkflowCoordinator:
         dry_run: bool = False,
         full_deploy: bool = False,
         collect_all_errors: bool = False,
+        include_command_string: bool = True,
+        max_errors: Optional[int] = None,
     ) -> Dict:
         """Run the complete SAID workflow.
 
@@ -406,6 +538,12 @@ class WorkflowCoordinator:
             validate_vars: If True, validate required variables.
             dry_run: If True, generate command with --check flag.
             full_deploy: If True, execute all tasks regardless of changes.
+            collect_all_errors: If True, collect validation errors into a report
+                instead of raising on the first one.
+            include_command_string: If False, skip shell-quoting the command for
+                callers that only need the argument list.
+            max_errors: Optional cap on the number of validation errors collected
+                when collect_all_errors is True.
 
         Returns:
             Dictionary containing:
@@ -413,7 +551,8 @@ class WorkflowCoordinator:
             - matched_tasks: Set of initially matched tasks
             - execution_order: List of tasks in execution order
             - command: List of command arguments
-            - command_string: Shell-escaped command string
+            - command_string: Shell-escaped command string (None if
+              include_command_string is False)
         """
         # Load dependency map
         self.load_dependency_map()
@@ -422,8 +561,8 @@ class WorkflowCoordinator:
         if full_deploy:
             self.logger.info("Full deploy requested - executing all tasks")
             changed_files = []
-            # Get all tasks
-            matched_tasks = set(task.name for task in self.dependency_map.tasks)
+            # Get all tasks; copied so callers never mutate the map's name set
+            matched_tasks = set(self.dependency_map.task_names)
         else:
             changed_files = self.get_changed_files(
                 from_commit=from_commit, to_commit=to_commit
@@ -433,7 +572,7 @@ class WorkflowCoordinator:
             if self.check_safety_conditions(changed_files):
                 self.logger.info("Safety check triggered - forcing full deploy")
                 changed_files = []
-                matched_tasks = set(task.name for task in self.dependency_map.tasks)
+                matched_tasks = set(self.dependency_map.task_names)
             elif not changed_files:
                 self.logger.info("No changed files found")
                 return {
@@ -476,16 +615,18 @@ class WorkflowCoordinator:
         validation_errors = None
         if validate_vars:
             validation_errors = self.validate_variables(
-                set(execution_order), collect_all_errors=collect_all_errors
+                set(execution_order),
+                collect_all_errors=collect_all_errors,
+                max_errors=max_errors,
             )
             if validation_errors and not collect_all_errors:
                 # If collect_all_errors is False, validate_variables will raise
                 pass
 
-        # Generate Ansible command
+        # Generate Ansible command once and derive the shell string from it
         command = self.generate_ansible_command(execution_order, dry_run=dry_run)
-        command_string = self.orchestrator.generate_command_string(
-            execution_order, dry_run=dry_run
+        command_string = (
+            self.orchestrator.format_command(command) if include_command_string else None
         )
 
         result = {
@@ -512,8 +653,11 @@ class WorkflowCoordinator:
         Raises:
             CoordinatorError: If the update fails.
         """
+        from said.state_store import StateStoreError
+
         try:
             self.state_store.set_last_successful_commit(commit_sha, environment)
+            self._cached_last_commit[environment] = commit_sha
             self.logger.info(
                 f"Updated last successful commit for {environment}: {commit_sha[:8]}..."
             )
@@ -1,12 +1,13 @@
 """DAG (Directed Acyclic Graph) builder for dependency resolution.
 
-This module uses NetworkX to build a directed graph from the dependency map,
-enabling efficient dependency traversal and cycle detection.
+This module builds a directed graph from the dependency map as plain
+adjacency maps, enabling efficient dependency traversal and cycle detection.
 """
 
-from typing import Dict, List, Set
-
-import networkx as nx
+import heapq
+import sys
+from collections import deque
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from said.schema import DependencyMap, SchemaError, TaskMetadata
 
@@ -26,44 +27,114 @@ class CycleDetectedError(DAGError):
 class DependencyGraph:
     """A directed graph representing task dependencies.
 
-    This class wraps a NetworkX DiGraph and provides methods for
-    dependency resolution and traversal.
+    The graph is stored as two adjacency maps (successors and predecessors)
+    keyed by task name, and provides methods for dependency resolution and
+    traversal.
+
+    Attributes:
+        dependency_map: The dependency map the graph was built from.
+        resource_to_tasks: Mapping of each provided resource to the names of
+            the tasks that provide it. Built once while constructing the graph
+            and kept for callers that need the same index.
     """
 
-    def __init__(self, dependency_map: DependencyMap):
+    # Graphs are built once per dependency map and never grow new attributes,
+    # so a fixed layout avoids a per-instance __dict__
+    __slots__ = (
+        "dependency_map",
+        "resource_to_tasks",
+        "_task_by_name",
+        "_decl_index",
+        "_succ",
+        "_pred",
+        "_topo_order",
+        "_topo_index",
+        "_ancestors",
+        "_descendants",
+        "_ancestor_masks",
+        "_descendant_masks",
+    )
+
+    def __init__(self, dependency_map: DependencyMap, strict: bool = True):
         """Build a dependency graph from a DependencyMap.
 
         Args:
             dependency_map: The dependency map to build the graph from.
+            strict: If True, dangling references and cycles raise. If False,
+                dangling references are skipped and cycles are left in place,
+                so the graph can be inspected for errors; tasks on or
+                downstream of a cycle are then missing from the topological
+                order.
 
         Raises:
-            CycleDetectedError: If a cycle is detected in the dependency graph.
-            DAGError: If the graph cannot be constructed.
+            CycleDetectedError: If strict and a cycle is detected in the
+                dependency graph.
+            DAGError: If strict and the graph cannot be constructed.
         """
         self.dependency_map = dependency_map
-        self.graph = nx.DiGraph()
-        self._build_graph()
-        self._detect_cycles()
+        self._task_by_name: Dict[str, TaskMetadata] = {}
+        self._decl_index: Dict[str, int] = {}
+        self._succ: Dict[str, List[str]] = {}
+        self._pred: Dict[str, List[str]] = {}
+        self.resource_to_tasks: Dict[str, Set[str]] = {}
+        self._build_graph(strict=strict)
+        if strict:
+            self._detect_cycles()
+
+        # The dependency map does not change after construction, so the
+        # topological order and transitive closures are computed at most once.
+        self._topo_order: List[str] = list(self._iter_topo())
+        self._topo_index: Dict[str, int] = {
+            name: position for position, name in enumerate(self._topo_order)
+        }
+        self._ancestors: Dict[str, FrozenSet[str]] = {}
+        self._descendants: Dict[str, FrozenSet[str]] = {}
+        self._ancestor_masks: Optional[List[int]] = None
+        self._descendant_masks: Optional[List[int]] = None
+
+    def _build_graph(self, strict: bool = True):
+        """Build the adjacency maps from the dependency map.
+
+        Args:
+            strict: If True, raise DAGError for dependencies on resources no
+                task provides and for triggers of unknown tasks. If False,
+                such references are skipped and only the valid edges are built.
 
-    def _build_graph(self):
-        """Build the NetworkX graph from the dependency map."""
-        # Add all tasks as nodes
-        for task in self.dependency_map.tasks:
-            self.graph.add_node(task.name, task=task)
+        Raises:
+            DAGError: If strict and the dependency map has dangling references.
+        """
+        # Intern names once so every set and dict built from this graph (and
+        # by its callers) shares the same string objects and cached hashes
+        intern = sys.intern
+        tasks = self.dependency_map.tasks
+        names = [intern(task.name) for task in tasks]
+
+        # Add all tasks as nodes, remembering their declaration order
+        for position, (name, task) in enumerate(zip(names, tasks)):
+            self._task_by_name[name] = task
+            self._decl_index[name] = position
+            self._succ[name] = []
+            self._pred[name] = []
 
         # Build edges based on dependencies
-        # Map: resource -> list of tasks that provide it
-        resource_to_tasks: Dict[str, List[str]] = {}
-        for task in self.dependency_map.tasks:
+        # Map: resource -> set of tasks that provide it
+        resource_to_tasks = self.resource_to_tasks
+        for name, task in zip(names, tasks):
             for resource in task.provides:
+                resource = intern(resource)
                 if resource not in resource_to_tasks:
-                    resource_to_tasks[resource] = []
-                resource_to_tasks[resource].append(task.name)
+                    resource_to_tasks[resource] = set()
+                resource_to_tasks[resource].add(name)
+
+        # Stage edges in a set so repeated resources or providers collapse
+        edges: Set[Tuple[str, str]] = set()
 
         # Add edges for depends_on relationships
-        for task in self.dependency_map.tasks:
+        for name, task in zip(names, tasks):
             for required_resource in task.depends_on:
                 if required_resource not in resource_to_tasks:
+                    if not strict:
+                        continue
                     raise DAGError(
                         f"Task '{task.name}' depends on resource '{required_resource}' "
                         f"but no task provides it. Available resources: "
@@ -72,19 +143,153 @@ class DependencyGraph:
 
                 # Task depends on all tasks that provide the required resource
                 for provider_task_name in resource_to_tasks[required_resource]:
-                    if provider_task_name != task.name:  # Avoid self-loops
-                        self.graph.add_edge(provider_task_name, task.name)
+                    if provider_task_name != name:  # Avoid self-loops
+                        edges.add((provider_task_name, name))
 
         # Add edges for triggers relationships
-        for task in self.dependency_map.tasks:
+        for name, task in zip(names, tasks):
             for triggered_task_name in task.triggers:
-                if triggered_task_name not in self.graph:
+                if triggered_task_name not in self._task_by_name:
+                    if not strict:
+                        continue
                     raise DAGError(
                         f"Task '{task.name}' triggers '{triggered_task_name}' "
                         "but that task does not exist in the dependency map."
                     )
                 # Triggered task depends on the triggering task
-                self.graph.add_edge(task.name, triggered_task_name)
+                edges.add((name, intern(triggered_task_name)))
+
+        # Materialize edges in declaration order so traversal order (and thus
+        # the topological sort) does not depend on string hashing
+        position = self._decl_index
+        for source, target in sorted(
+            edges, key=lambda edge: (position[edge[0]], position[edge[1]])
+        ):
+            self._succ[source].append(target)
+            self._pred[target].append(source)
+
+    def _iter_topo(self) -> Iterator[str]:
+        """Run Kahn's algorithm over the adjacency maps, yielding lazily.
+
+        Ready tasks are taken from a priority queue rather than a FIFO: tasks
+        with the most dependents come first, and ties fall back to declaration
+        order. The result is deterministic for a given dependency map and
+        unblocks as much of the graph as early as possible.
+
+        Yields:
+            Task names in topological order. If the graph contains a cycle,
+            the nodes on (or downstream of) the cycle are never yielded.
+        """
+        succ = self._succ
+        decl_index = self._decl_index
+        in_degree = {name: len(preds) for name, preds in self._pred.items()}
+        heap = [
+            (-len(succ[name]), decl_index[name], name)
+            for name, degree in in_degree.items()
+            if degree == 0
+        ]
+        heapq.heapify(heap)
+
+        while heap:
+            name = heapq.heappop(heap)[2]
+            yield name
+            for successor in succ[name]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    heapq.heappush(
+                        heap,
+                        (-len(succ[successor]), decl_index[successor], successor),
+                    )
+
+    def _iter_cyclic_components(self) -> Iterator[List[str]]:
+        """Yield every strongly connected component that contains a cycle.
+
+        Uses an iterative version of Tarjan's algorithm so deep graphs do not
+        hit the interpreter's recursion limit.
+
+        Yields:
+            Task names of each cyclic component, in the order Tarjan's
+            algorithm completes them.
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        scc_stack: List[str] = []
+        counter = 0
+
+        for root in self._task_by_name:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._succ[root]))]
+
+            while work:
+                node, successors = work[-1]
+                descended = False
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        scc_stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self._succ[successor])))
+                        descended = True
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self._succ[node]:
+                        yield component
+
+    def _cycle_in_component(self, component: List[str]) -> List[str]:
+        """Reconstruct one cycle path inside a strongly connected component.
+
+        Args:
+            component: Task names of a cyclic strongly connected component.
+
+        Returns:
+            Task names along a cycle, starting and ending implicitly at the
+            first element.
+        """
+        members = set(component)
+        start = next(name for name in self._task_by_name if name in members)
+        parents: Dict[str, str] = {}
+        queue = deque([start])
+
+        while queue:
+            node = queue.popleft()
+            for successor in self._succ[node]:
+                if successor == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path
+                if successor in members and successor not in parents:
+                    parents[successor] = node
+                    queue.append(successor)
+
+        # Unreachable for a genuine strongly connected component
+        return [start]
 
     def _detect_cycles(self):
         """Detect cycles in the dependency graph.
@@ -92,16 +297,16 @@ class DependencyGraph:
         Raises:
             CycleDetectedError: If a cycle is detected.
         """
-        try:
-            cycles = list(nx.simple_cycles(self.graph))
-            if cycles:
-                cycle_strs = [" -> ".join(cycle) + f" -> {cycle[0]}" for cycle in cycles]
-                raise CycleDetectedError(
-                    f"Circular dependency detected in dependency graph:\n"
-                    + "\n".join(f"  - {cycle_str}" for cycle_str in cycle_strs)
-                )
-        except nx.NetworkXError as e:
-            raise DAGError(f"Error detecting cycles: {e}")
+        component = next(self._iter_cyclic_components(), None)
+        if component is None:
+            return
+
+        cycle = self._cycle_in_component(component)
+        cycle_str = " -> ".join(cycle) + f" -> {cycle[0]}"
+        raise CycleDetectedError(
+            "Circular dependency detected in dependency graph:\n"
+            f"  - {cycle_str}"
+        )
 
     def get_task(self, task_name: str) -> TaskMetadata:
         """Get a task by name from the graph.
@@ -115,10 +320,10 @@ class DependencyGraph:
         Raises:
             DAGError: If the task is not found.
         """
-        if task_name not in self.graph:
+        if task_name not in self._task_by_name:
             raise DAGError(f"Task '{task_name}' not found in dependency graph")
 
-        return self.graph.nodes[task_name]["task"]
+        return self._task_by_name[task_name]
 
     def get_dependencies(self, task_name: str) -> Set[str]:
         """Get all direct dependencies of a task.
@@ -132,11 +337,11 @@ class DependencyGraph:
         Raises:
             DAGError: If the task is not found.
         """
-        if task_name not in self.graph:
+        if task_name not in self._task_by_name:
             raise DAGError(f"Task '{task_name}' not found in dependency graph")
 
         # Get all predecessors (tasks that this task depends on)
-        return set(self.graph.predecessors(task_name))
+        return set(self._pred[task_name])
 
     def get_dependents(self, task_name: str) -> Set[str]:
         """Get all tasks that directly depend on this task.
@@ -150,11 +355,63 @@ class DependencyGraph:
         Raises:
             DAGError: If the task is not found.
         """
-        if task_name not in self.graph:
+        if task_name not in self._task_by_name:
             raise DAGError(f"Task '{task_name}' not found in dependency graph")
 
         # Get all successors (tasks that depend on this task)
-        return set(self.graph.successors(task_name))
+        return set(self._succ[task_name])
+
+    def _closure_masks(self, adjacency: Dict[str, List[str]]) -> List[int]:
+        """Compute the transitive closure of every task in one batched pass.
+
+        Each task is identified by its position in the topological order and
+        each reachable set is an integer bitmask over those positions, so the
+        per-edge work is a single C-level big-integer OR.
+
+        Args:
+            adjacency: ``self._pred`` for ancestors or ``self._succ`` for
+                descendants.
+
+        Returns:
+            List of bitmasks indexed by topological position.
+        """
+        index = self._topo_index
+        masks = [0] * len(self._topo_order)
+        # Predecessors are finished before their dependents in topological
+        # order; successors are finished first in reverse order.
+        if adjacency is self._pred:
+            order = self._topo_order
+        else:
+            order = reversed(self._topo_order)
+        for name in order:
+            mask = 0
+            for neighbour in adjacency[name]:
+                position = index[neighbour]
+                mask |= masks[position] | (1 << position)
+            masks[index[name]] = mask
+        return masks
+
+    def _names_from_mask(self, mask: int) -> FrozenSet[str]:
+        """Translate a topological-position bitmask back to task names."""
+        order = self._topo_order
+        names = []
+        while mask:
+            lowest = mask & -mask
+            names.append(order[lowest.bit_length() - 1])
+            mask ^= lowest
+        return frozenset(names)
+
+    def _cached_ancestors(self, task_name: str) -> FrozenSet[str]:
+        """Return the memoized transitive predecessors of a known task."""
+        ancestors = self._ancestors.get(task_name)
+        if ancestors is None:
+            if self._ancestor_masks is None:
+                self._ancestor_masks = self._closure_masks(self._pred)
+            ancestors = self._names_from_mask(
+                self._ancestor_masks[self._topo_index[task_name]]
+            )
+            self._ancestors[task_name] = ancestors
+        return ancestors
 
     def get_all_dependencies(self, task_name: str) -> Set[str]:
         """Get all transitive dependencies of a task (recursive).
@@ -168,11 +425,10 @@ class DependencyGraph:
         Raises:
             DAGError: If the task is not found.
         """
-        if task_name not in self.graph:
+        if task_name not in self._task_by_name:
             raise DAGError(f"Task '{task_name}' not found in dependency graph")
 
-        # Use NetworkX to get all ancestors (transitive predecessors)
-        return set(nx.ancestors(self.graph, task_name))
+        return set(self._cached_ancestors(task_name))
 
     def get_all_dependents(self, task_name: str) -> Set[str]:
         """Get all tasks that depend on this task (transitive).
@@ -186,11 +442,65 @@ class DependencyGraph:
         Raises:
             DAGError: If the task is not found.
         """
-        if task_name not in self.graph:
+        if task_name not in self._task_by_name:
             raise DAGError(f"Task '{task_name}' not found in dependency graph")
 
-        # Use NetworkX to get all descendants (transitive successors)
-        return set(nx.descendants(self.graph, task_name))
+        descendants = self._descendants.get(task_name)
+        if descendants is None:
+            if self._descendant_masks is None:
+                self._descendant_masks = self._closure_masks(self._succ)
+            descendants = self._names_from_mask(
+                self._descendant_masks[self._topo_index[task_name]]
+            )
+            self._descendants[task_name] = descendants
+        return set(descendants)
+
+    def collect(
+        self,
+        task_names: Set[str],
+        include_dependencies: bool = True,
+        include_dependents: bool = False,
+    ) -> Set[str]:
+        """Collect tasks together with their transitive relatives in one pass.
+
+        Equivalent to the union of the tasks with get_all_dependencies and/or
+        get_all_dependents of each, but the closure bitmasks of all tasks are
+        OR-ed together and translated back to names only once, so relatives
+        shared between tasks cost nothing extra.
+
+        Args:
+            task_names: Set of task names to start from.
+            include_dependencies: If True, include every task the given tasks
+                depend on (directly or indirectly).
+            include_dependents: If True, include every task that depends on
+                the given tasks (directly or indirectly).
+
+        Returns:
+            Set of the given task names and the requested relatives.
+
+        Raises:
+            DAGError: If any task is not found.
+        """
+        for task_name in task_names:
+            if task_name not in self._task_by_name:
+                raise DAGError(f"Task '{task_name}' not found in dependency graph")
+
+        if include_dependencies and self._ancestor_masks is None:
+            self._ancestor_masks = self._closure_masks(self._pred)
+        if include_dependents and self._descendant_masks is None:
+            self._descendant_masks = self._closure_masks(self._succ)
+
+        index = self._topo_index
+        mask = 0
+        for task_name in task_names:
+            position = index[task_name]
+            mask |= 1 << position
+            if include_dependencies:
+                mask |= self._ancestor_masks[position]
+            if include_dependents:
+                mask |= self._descendant_masks[position]
+
+        return set(self._names_from_mask(mask))
 
     def topological_sort(self) -> List[str]:
         """Get a topological sort of all tasks.
@@ -199,15 +509,8 @@ class DependencyGraph:
 
         Returns:
             List of task names in topological order.
-
-        Raises:
-            DAGError: If the graph cannot be topologically sorted (should not happen
-                     if cycle detection passed).
         """
-        try:
-            return list(nx.topological_sort(self.graph))
-        except nx.NetworkXError as e:
-            raise DAGError(f"Failed to perform topological sort: {e}")
+        return list(self._topo_order)
 
     def get_execution_order(self, task_names: Set[str]) -> List[str]:
         """Get execution order for a set of tasks and their dependencies.
@@ -224,22 +527,22 @@ class DependencyGraph:
         Raises:
             DAGError: If any task is not found or sorting fails.
         """
-        # Collect all tasks that need to be executed
-        all_tasks = set(task_names)
-
-        # Add all dependencies
         for task_name in task_names:
-            if task_name not in self.graph:
+            if task_name not in self._task_by_name:
                 raise DAGError(f"Task '{task_name}' not found in dependency graph")
-            all_tasks.update(self.get_all_dependencies(task_name))
 
-        # Get topological sort of entire graph
-        full_order = self.topological_sort()
-
-        # Filter to only include tasks we need, preserving order
-        execution_order = [task for task in full_order if task in all_tasks]
+        # Collect the requested tasks and all their dependencies with a single
+        # multi-source walk, so shared ancestors are visited only once
+        all_tasks = set(task_names)
+        queue = deque(all_tasks)
+        while queue:
+            for dependency in self._pred[queue.popleft()]:
+                if dependency not in all_tasks:
+                    all_tasks.add(dependency)
+                    queue.append(dependency)
 
-        return execution_order
+        # Order by position in the cached topological sort
+        return sorted(all_tasks, key=self._topo_index.__getitem__)
 
     def get_all_tasks(self) -> Set[str]:
         """Get all task names in the graph.
@@ -247,4 +550,61 @@ class DependencyGraph:
         Returns:
             Set of all task names.
         """
-        return set(self.graph.nodes())
+        return set(self._task_by_name)
+
+
+def find_scc_cycles(dependency_map: DependencyMap) -> List[List[str]]:
+    """Find every circular dependency in a dependency map.
+
+    Unlike constructing a DependencyGraph, this does not stop at the first
+    cycle, and dependencies on unknown resources or tasks are ignored rather
+    than raised, so it can be used on maps that have other errors.
+
+    Args:
+        dependency_map: The dependency map to inspect.
+
+    Returns:
+        One list per strongly connected component that contains a cycle,
+        holding its task names in declaration order. Components are ordered
+        by the declaration position of their first task. Empty if the map is
+        acyclic.
+    """
+    graph = DependencyGraph(dependency_map, strict=False)
+    return _sorted_cyclic_components(graph)
+
+
+def find_cycle_paths(dependency_map: DependencyMap) -> List[Tuple[List[str], List[str]]]:
+    """Find every circular dependency along with one cycle path through it.
+
+    Args:
+        dependency_map: The dependency map to inspect.
+
+    Returns:
+        One (members, path) pair per cyclic component, in the same order as
+        find_scc_cycles. members is the component as find_scc_cycles returns
+        it; path lists the tasks along one cycle, which returns to path[0].
+    """
+    graph = DependencyGraph(dependency_map, strict=False)
+    return [
+        (component, graph._cycle_in_component(component))
+        for component in _sorted_cyclic_components(graph)
+    ]
+
+
+def _sorted_cyclic_components(graph: DependencyGraph) -> List[List[str]]:
+    """Collect a graph's cyclic components in declaration order.
+
+    Args:
+        graph: The graph to inspect.
+
+    Returns:
+        Each cyclic component's task names in declaration order, with the
+        components ordered by the declaration position of their first task.
+    """
+    position = graph._decl_index
+    cycles = [
+        sorted(component, key=position.__getitem__)
+        for component in graph._iter_cyclic_components()
+    ]
+    cycles.sort(key=lambda cycle: position[cycle[0]])
+    return cycles
@@ -4,14 +4,37 @@ This module provides functionality to collect all dependency-related errors
 and format them as JSON for programmatic consumption.
 """
 
+import json
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, TextIO, Union
 
+from said.dag_builder import find_cycle_paths
 from said.schema import DependencyMap
-
-
-@dataclass
+from said.validator import VariableValidator
+from said.variable_dependency_analyzer import analyze_variable_dependencies_comprehensive
+from said.variable_searcher import find_all_variable_suggestions
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+if orjson is not None:
+    # Match the stdlib encoder: stringify non-str keys, and leave dataclasses
+    # and datetimes unencoded so they fail the same way they do in json.dumps
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+@dataclass(slots=True)
 class DependencyError:
     """Represents a single dependency error."""
 
@@ -21,7 +44,7 @@ class DependencyError:
     details: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyErrorReport:
     """Collection of all dependency errors."""
 
@@ -35,41 +58,87 @@ class DependencyErrorReport:
         Returns:
             Dictionary representation of the error report.
         """
-        errors_list = []
-        for err in self.errors:
-            error_dict = {
-                "error_type": err.error_type,
-                "task_name": err.task_name,
-                "details": err.details,
-            }
-            # If message is already a dict (structured), use it directly
-            # Otherwise, use it as a string
-            if isinstance(err.message, dict):
-                error_dict["message"] = err.message
-            else:
-                error_dict["message"] = err.message
-            
-            errors_list.append(error_dict)
-        
         return {
             "total_errors": self.total_errors,
             "error_summary": self.error_summary,
-            "errors": errors_list,
+            "errors": [self._error_to_dict(err) for err in self.errors],
+        }
+
+    @staticmethod
+    def _error_to_dict(err: DependencyError) -> Dict:
+        """Convert a single error to its dictionary form.
+
+        Args:
+            err: The error to convert.
+
+        Returns:
+            Dictionary representation of the error.
+        """
+        # message is used as-is: either a structured dict or a plain string
+        return {
+            "error_type": err.error_type,
+            "task_name": err.task_name,
+            "details": err.details,
+            "message": err.message,
         }
 
     def to_json(self, indent: int = 2) -> str:
         """Convert error report to JSON string.
 
+        The result matches json.dumps(self.to_dict(), indent=indent), except
+        that floats may be written in another equivalent form (e.g. 1e16 for
+        1e+16). orjson is used when it is installed and can produce that
+        document; otherwise the stdlib encoder is used.
+
         Args:
             indent: JSON indentation level.
 
         Returns:
             JSON string representation.
         """
-        import json
+        report = self.to_dict()
+        # orjson only supports two-space indentation
+        if orjson is not None and indent == 2:
+            try:
+                encoded = orjson.dumps(report, option=_ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, or types only the stdlib
+                # encoder should decide about
+                encoded = None
+            # orjson writes non-ASCII characters as-is, the stdlib escapes them
+            if encoded is not None and encoded.isascii():
+                return encoded.decode()
+        return json.dumps(report, indent=indent)
+
+    def write_json(self, fp: TextIO, indent: int = 2) -> None:
+        """Stream the error report as JSON to a file-like object.
+
+        Produces the same document as json.dumps(self.to_dict(), indent=indent),
+        but encodes and writes one error at a time instead of building the
+        whole report in memory first.
+
+        Args:
+            fp: Writable text stream (e.g. sys.stdout or an open file).
+            indent: JSON indentation level.
+        """
+        pad = " " * indent
+        fp.write("{\n")
+        fp.write(f"{pad}\"total_errors\": {json.dumps(self.total_errors)},\n")
+        summary = json.dumps(self.error_summary, indent=indent).replace("\n", "\n" + pad)
+        fp.write(f"{pad}\"error_summary\": {summary},\n")
+
+        if not self.errors:
+            fp.write(f"{pad}\"errors\": []\n}}")
+            return
+
+        fp.write(f"{pad}\"errors\": [")
+        separator = "\n"
+        for err in self.errors:
+            encoded = json.dumps(self._error_to_dict(err), indent=indent)
+            fp.write(separator + pad * 2 + encoded.replace("\n", "\n" + pad * 2))
+            separator = ",\n"
+        fp.write(f"\n{pad}]\n}}")
 
-        return json.dumps(self.to_dict(), indent=indent)
-    
     def has_errors(self) -> bool:
         """Check if the error report contains any errors.
 
@@ -86,6 +155,14 @@ class DependencyErrorCollector:
         """Initialize the error collector."""
         self.errors: List[DependencyError] = []
 
+    def add(self, error: DependencyError) -> None:
+        """Record an error found outside the collect_* methods.
+
+        Args:
+            error: The error to record.
+        """
+        self.errors.append(error)
+
     def collect_missing_variables(
         self,
         validation_results: Dict[str, Set[str]],
@@ -107,8 +184,6 @@ class DependencyErrorCollector:
             search_for_suggestions: If True, search for where variables might be defined.
             known_variables: Optional dictionary of known variables.
         """
-        from said.variable_dependency_analyzer import analyze_variable_dependencies_comprehensive
-
         # If we have a dependency map, do comprehensive two-pass analysis
         if dependency_map and search_for_suggestions:
             analysis = analyze_variable_dependencies_comprehensive(
@@ -118,8 +193,9 @@ class DependencyErrorCollector:
             # Use the analysis to build better error messages
             for task_name, missing_vars in validation_results.items():
                 if missing_vars:
+                    sorted_missing = sorted(missing_vars)
                     error_details = {
-                        "missing_variables": sorted(list(missing_vars)),
+                        "missing_variables": sorted_missing,
                     }
 
                     # For each missing variable, show what could produce it
@@ -137,22 +213,19 @@ class DependencyErrorCollector:
                     if task_name in analysis["task_dependencies"]:
                         error_details["suggested_task_dependencies"] = analysis["task_dependencies"][task_name]
 
-                    self.errors.append(
+                    self.add(
                         DependencyError(
                             error_type="missing_variable",
                             task_name=task_name,
-                            message=f"Task '{task_name}' requires variables that are not defined: {', '.join(sorted(missing_vars))}",
+                            message=f"Task '{task_name}' requires variables that are not defined: {', '.join(sorted_missing)}",
                             details=error_details,
                         )
                     )
         else:
             # Fallback to simple suggestions
-            from said.variable_searcher import find_all_variable_suggestions
 
             # Collect all unique missing variables
-            all_missing_vars = set()
-            for missing_vars in validation_results.values():
-                all_missing_vars.update(missing_vars)
+            all_missing_vars = set().union(*validation_results.values())
 
             # Search for suggestions if requested
             suggestions = {}
@@ -162,22 +235,24 @@ class DependencyErrorCollector:
             for task_name, missing_vars in validation_results.items():
                 if missing_vars:
                     # Build suggestions for this task's missing variables
-                    task_suggestions = {}
-                    for var_name in missing_vars:
-                        if var_name in suggestions:
-                            task_suggestions[var_name] = suggestions[var_name]
+                    task_suggestions = {
+                        var_name: suggestions[var_name]
+                        for var_name in missing_vars
+                        if var_name in suggestions
+                    }
 
+                    sorted_missing = sorted(missing_vars)
                     error_details = {
-                        "missing_variables": sorted(list(missing_vars)),
+                        "missing_variables": sorted_missing,
                     }
                     if task_suggestions:
                         error_details["suggestions"] = task_suggestions
 
-                    self.errors.append(
+                    self.add(
                         DependencyError(
                             error_type="missing_variable",
                             task_name=task_name,
-                            message=f"Task '{task_name}' requires variables that are not defined: {', '.join(sorted(missing_vars))}",
+                            message=f"Task '{task_name}' requires variables that are not defined: {', '.join(sorted_missing)}",
                             details=error_details,
                         )
                     )
@@ -190,49 +265,63 @@ class DependencyErrorCollector:
         Args:
             dependency_map: The dependency map to validate.
         """
-        # Build map of resources to tasks that provide them
-        resource_to_tasks: Dict[str, List[str]] = {}
-        for task in dependency_map.tasks:
-            for resource in task.provides:
-                if resource not in resource_to_tasks:
-                    resource_to_tasks[resource] = []
-                resource_to_tasks[resource].append(task.name)
+        # Only membership matters here, so collect the provided resources
+        # into a frozenset rather than mapping each one to its providers
+        provided_resources: FrozenSet[str] = frozenset(
+            sys.intern(resource)
+            for task in dependency_map.tasks
+            for resource in task.provides
+        )
+
+        # Sorted once, on the first error, and shared by every error's details
+        available_resources: Optional[List[str]] = None
 
         # Check for missing dependencies
         for task in dependency_map.tasks:
             for required_resource in task.depends_on:
-                if required_resource not in resource_to_tasks:
-                    self.errors.append(
+                if required_resource not in provided_resources:
+                    if available_resources is None:
+                        available_resources = sorted(provided_resources)
+                    self.add(
                         DependencyError(
                             error_type="missing_dependency",
                             task_name=task.name,
                             message=f"Task '{task.name}' depends on resource '{required_resource}' but no task provides it",
                             details={
                                 "required_resource": required_resource,
-                                "available_resources": sorted(list(resource_to_tasks.keys())),
+                                "available_resources": available_resources,
                             },
                         )
                     )
 
-    def collect_missing_triggers(self, dependency_map: DependencyMap) -> None:
+    def collect_missing_triggers(
+        self,
+        dependency_map: DependencyMap,
+        all_task_names: Optional[FrozenSet[str]] = None,
+    ) -> None:
         """Collect missing trigger errors (tasks triggering non-existent tasks).
 
         Args:
             dependency_map: The dependency map to validate.
+            all_task_names: Optional precomputed set of every task name in the map.
         """
-        all_task_names = {task.name for task in dependency_map.tasks}
+        if all_task_names is None:
+            all_task_names = frozenset(task.name for task in dependency_map.tasks)
+        available_tasks: Optional[List[str]] = None
 
         for task in dependency_map.tasks:
             for triggered_task_name in task.triggers:
                 if triggered_task_name not in all_task_names:
-                    self.errors.append(
+                    if available_tasks is None:
+                        available_tasks = sorted(all_task_names)
+                    self.add(
                         DependencyError(
                             error_type="missing_trigger",
                             task_name=task.name,
                             message=f"Task '{task.name}' triggers '{triggered_task_name}' but that task does not exist",
                             details={
                                 "triggered_task": triggered_task_name,
-                                "available_tasks": sorted(list(all_task_names)),
+                                "available_tasks": available_tasks,
                             },
                         )
                     )
@@ -240,75 +329,55 @@ class DependencyErrorCollector:
     def collect_circular_dependencies(
         self, dependency_map: DependencyMap
     ) -> None:
-        """Collect circular dependency errors.
+        """Collect circular dependency errors, one per cycle found.
+
+        Each error's details hold "cycle", the tasks of the strongly connected
+        component in declaration order, and "cycles", a one-element list with
+        a cycle path through it in "a -> b -> a" form.
 
         Args:
             dependency_map: The dependency map to validate.
         """
-        try:
-            from said.dag_builder import CycleDetectedError, DependencyGraph
-
-            try:
-                graph = DependencyGraph(dependency_map)
-                # If we get here, no cycles were detected
-            except CycleDetectedError as e:
-                # Extract cycle information from error message
-                error_msg = str(e)
-                # Try to parse cycles from the error message
-                cycles = []
-                if "Circular dependency" in error_msg:
-                    # Extract cycle paths from error message
-                    lines = error_msg.split("\n")
-                    for line in lines:
-                        if "->" in line and line.strip().startswith("-"):
-                            cycle_path = line.strip()[2:].strip()  # Remove "- " prefix
-                            cycles.append(cycle_path)
-
-                self.errors.append(
-                    DependencyError(
-                        error_type="circular_dependency",
-                        task_name="multiple",
-                        message=error_msg,
-                        details={
-                            "error_details": error_msg,
-                            "cycles": cycles if cycles else [error_msg],
-                        },
-                    )
-                )
-        except Exception as e:
-            # Fallback for any other errors during cycle detection
-            error_msg = str(e)
-            if "circular" in error_msg.lower() or "cycle" in error_msg.lower():
-                self.errors.append(
-                    DependencyError(
-                        error_type="circular_dependency",
-                        task_name="multiple",
-                        message=error_msg,
-                        details={"error_details": error_msg},
-                    )
+        for cycle, path in find_cycle_paths(dependency_map):
+            cycle_path = " -> ".join(path) + f" -> {path[0]}"
+            self.add(
+                DependencyError(
+                    error_type="circular_dependency",
+                    task_name="multiple",
+                    message=f"Circular dependency detected between tasks: {', '.join(cycle)}",
+                    details={"cycle": cycle, "cycles": [cycle_path]},
                 )
+            )
 
     def collect_invalid_task_references(
-        self, task_names: Set[str], dependency_map: DependencyMap
+        self,
+        task_names: Set[str],
+        dependency_map: DependencyMap,
+        all_task_names: Optional[FrozenSet[str]] = None,
     ) -> None:
         """Collect errors for task names that don't exist in the dependency map.
 
         Args:
             task_names: Set of task names to check.
             dependency_map: The dependency map to validate against.
+            all_task_names: Optional precomputed set of every task name in the map.
         """
-        all_task_names = {task.name for task in dependency_map.tasks}
+        if all_task_names is None:
+            all_task_names = frozenset(task.name for task in dependency_map.tasks)
         invalid_tasks = task_names - all_task_names
+        if not invalid_tasks:
+            return
+        available_tasks = sorted(all_task_names)
 
         for invalid_task in invalid_tasks:
-            self.errors.append(
+            self.add(
                 DependencyError(
                     error_type="invalid_task_reference",
                     task_name=invalid_task,
                     message=f"Task '{invalid_task}' is referenced but does not exist in dependency map",
                     details={
                         "referenced_task": invalid_task,
-                        "available_tasks": sorted(list(all_task_names)),
+                        "available_tasks": available_tasks,
                     },
                 )
             )
@@ -319,15 +388,12 @@ class DependencyErrorCollector:
         Returns:
             DependencyErrorReport with all collected errors.
         """
-        # Count errors by type
-        error_summary = {}
-        for error in self.errors:
-            error_summary[error.error_type] = error_summary.get(error.error_type, 0) + 1
-
+        # Counted from the errors themselves, so errors appended to the
+        # errors list directly are summarized too
         return DependencyErrorReport(
             errors=self.errors,
             total_errors=len(self.errors),
-            error_summary=error_summary,
+            error_summary=dict(Counter(error.error_type for error in self.errors)),
         )
 
     def has_errors(self) -> bool:
@@ -339,21 +405,20 @@ class DependencyErrorCollector:
         return len(self.errors) > 0
 
 
-def validate_dependency_map_comprehensive(
+def iter_validation_errors(
     dependency_map: DependencyMap,
     task_names: Optional[Set[str]] = None,
     variables: Optional[Dict] = None,
     search_base: Optional[Path] = None,
     search_for_suggestions: bool = True,
-) -> DependencyErrorReport:
-    """Comprehensively validate a dependency map and collect all errors.
+) -> Iterator[DependencyError]:
+    """Lazily yield dependency errors, one validation stage at a time.
 
-    This function checks for:
-    - Missing variables
-    - Missing dependencies (resources that don't exist)
-    - Missing triggers (tasks that don't exist)
-    - Circular dependencies
-    - Invalid task references
+    Stages run in the same order as validate_dependency_map_comprehensive, and
+    a stage only runs once the caller has consumed every error from the
+    previous ones. A caller that stops early (e.g. via itertools.islice)
+    therefore skips the remaining stages, including the comparatively
+    expensive variable analysis and suggestion search.
 
     Args:
         dependency_map: The dependency map to validate.
@@ -362,28 +427,43 @@ def validate_dependency_map_comprehensive(
         search_base: Base directory to search for variable definitions. Defaults to current directory.
         search_for_suggestions: If True, search for where missing variables might be defined.
 
-    Returns:
-        DependencyErrorReport containing all discovered errors.
+    Yields:
+        DependencyError instances in discovery order.
     """
     collector = DependencyErrorCollector()
+    emitted = 0
+
+    # Shared by every stage that needs the full set of task names; interned
+    # like the dependency graph's names so both share the same string objects
+    all_task_names = frozenset(sys.intern(task.name) for task in dependency_map.tasks)
+
+    def drain() -> Iterator[DependencyError]:
+        nonlocal emitted
+        new_errors = collector.errors[emitted:]
+        emitted = len(collector.errors)
+        return iter(new_errors)
 
     # Collect missing dependencies
     collector.collect_missing_dependencies(dependency_map)
+    yield from drain()
 
     # Collect missing triggers
-    collector.collect_missing_triggers(dependency_map)
+    collector.collect_missing_triggers(dependency_map, all_task_names)
+    yield from drain()
 
     # Collect circular dependencies
     collector.collect_circular_dependencies(dependency_map)
+    yield from drain()
 
     # Collect invalid task references if task_names provided
     if task_names:
-        collector.collect_invalid_task_references(task_names, dependency_map)
+        collector.collect_invalid_task_references(
+            task_names, dependency_map, all_task_names
+        )
+        yield from drain()
 
     # Collect missing variables if variables provided
     if variables:
-        from said.validator import VariableValidator
-
         validator = VariableValidator(variables)
         if task_names:
             validation_results = validator.validate_dependency_map(
@@ -391,7 +471,6 @@ def validate_dependency_map_comprehensive(
             )
         else:
             # Validate all tasks
-            all_task_names = {task.name for task in dependency_map.tasks}
             validation_results = validator.validate_dependency_map(
                 dependency_map, all_task_names
             )
@@ -402,5 +481,49 @@ def validate_dependency_map_comprehensive(
             search_for_suggestions=search_for_suggestions,
             known_variables=variables,
         )
+        yield from drain()
+
+
+def validate_dependency_map_comprehensive(
+    dependency_map: DependencyMap,
+    task_names: Optional[Set[str]] = None,
+    variables: Optional[Dict] = None,
+    search_base: Optional[Path] = None,
+    search_for_suggestions: bool = True,
+    max_errors: Optional[int] = None,
+) -> DependencyErrorReport:
+    """Comprehensively validate a dependency map and collect all errors.
 
+    This function checks for:
+    - Missing variables
+    - Missing dependencies (resources that don't exist)
+    - Missing triggers (tasks that don't exist)
+    - Circular dependencies
+    - Invalid task references
+
+    Args:
+        dependency_map: The dependency map to validate.
+        task_names: Optional set of task names to validate. If None, validates all tasks.
+        variables: Optional dictionary of available variables for validation.
+        search_base: Base directory to search for variable definitions. Defaults to current directory.
+        search_for_suggestions: If True, search for where missing variables might be defined.
+        max_errors: Optional cap on the number of errors collected. Validation
+            stages after the cap is reached are not run.
+
+    Returns:
+        DependencyErrorReport containing all discovered errors.
+    """
+    errors = iter_validation_errors(
+        dependency_map,
+        task_names=task_names,
+        variables=variables,
+        search_base=search_base,
+        search_for_suggestions=search_for_suggestions,
+    )
+    if max_errors is not None:
+        errors = islice(errors, max_errors)
+
+    collector = DependencyErrorCollector()
+    for error in errors:
+        collector.add(error)
     return collector.generate_report()
@@ -1,11 +1,24 @@
 """Parse and structure error messages into JSON format."""
 
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from said.schema import DependencyMap
 
+# Matches: Task 'name' depends on non-existent resources: {set}. Available resources: list
+# Also handles the "Invalid dependency map structure: " prefix.
+# Task name can contain spaces, so we match everything between single quotes.
+# Invalid deps can be in set format: {'dep1', 'dep2'} or just {dep1}
+_DEP_ERROR_RE = re.compile(
+    r"(?:Invalid dependency map structure: )?Task '([^']+)' depends on non-existent "
+    r"resources: \{([^}]+)\}\. Available resources: (.+)"
+)
+
+# Literal fragment every message matched by _DEP_ERROR_RE contains
+_DEP_ERROR_MARKER = "depends on non-existent resources: {"
+
 
 def parse_dependency_error(error_message: str) -> Optional[Dict]:
     """Parse a dependency error message and extract structured information.
@@ -21,12 +34,7 @@ def parse_dependency_error(error_message: str) -> Optional[Dict]:
     Returns:
         Dictionary with structured error information, or None if parsing fails.
     """
-    # Pattern to match: Task 'name' depends on non-existent resources: {set}. Available resources: list
-    # Also handle "Invalid dependency map structure: " prefix
-    # Task name can contain spaces, so we match everything between single quotes
-    # Invalid deps can be in set format: {'dep1', 'dep2'} or just {dep1}
-    pattern = r"(?:Invalid dependency map structure: )?Task '([^']+)' depends on non-existent resources: \{([^}]+)\}\. Available resources: (.+)"
-    match = re.search(pattern, error_message)
+    match = _DEP_ERROR_RE.search(error_message)
     
     if match:
         task_name = match.group(1)
@@ -57,6 +65,27 @@ def parse_dependency_error(error_message: str) -> Optional[Dict]:
     return None
 
 
+def parse_dependency_errors_bulk(error_messages: List[str]) -> List[Optional[Dict]]:
+    """Parse many dependency error messages in one call.
+
+    Messages that cannot match are rejected with a plain substring test
+    before the regular expression runs, which is the common case when a
+    build reports many unrelated errors.
+
+    Args:
+        error_messages: The error message strings to parse.
+
+    Returns:
+        List with one entry per message: the structured error information, or
+        None if that message could not be parsed.
+    """
+    marker = _DEP_ERROR_MARKER
+    return [
+        parse_dependency_error(message) if marker in message else None
+        for message in error_messages
+    ]
+
+
 def structure_dependency_error(
     error_message: str,
     error_class: str = "BuilderError",
@@ -81,57 +110,67 @@ def structure_dependency_error(
     if parsed:
         # Build available resources as a dict: {resource: producing_task, variable: producing_task}
         available_resources_dict = {}
-        
-        # FIRST: Add variables and their producing tasks using the two-pass analyzer
-        # This is the key enhancement - include ALL variables, not just resources
+        invalid_dependencies = parsed["invalid_dependencies"]
+
+        # Index each resource to the first task that provides it
+        provider_index: Dict[str, str] = {}
         if dependency_map:
+            for task in dependency_map.tasks:
+                for resource in task.provides:
+                    provider_index.setdefault(sys.intern(resource), task.name)
+
+        # FIRST: Add the producing tasks of the variables this error mentions,
+        # using the two-pass analyzer. Its file-system search dominates the
+        # cost, so it is skipped when the message already lists every invalid
+        # dependency as an available resource that a task provides.
+        listed_resources = frozenset(parsed["available_resources"])
+        explained = all(
+            dep in listed_resources and dep in provider_index for dep in invalid_dependencies
+        )
+        if dependency_map and not explained:
             from said.variable_dependency_analyzer import build_producers_dictionary
-            
+
+            # Only names from the message appear in the output
+            needed_names = dict.fromkeys(invalid_dependencies + parsed["available_resources"])
+
             try:
                 producers = build_producers_dictionary(
                     dependency_map, search_base=search_base, known_variables=known_variables
                 )
-                
-                # Add ALL variables to available_resources_dict as {variable: producing_task}
-                for var_name, var_producers in producers.items():
+
+                for var_name in needed_names:
+                    var_producers = producers.get(var_name)
+                    if not var_producers:
+                        continue
                     # Find task-based producers (prefer tasks over files)
-                    task_producer = None
-                    for producer in var_producers:
-                        if producer.source_type == "task":
-                            task_producer = producer.source_name
-                            break
-                    
+                    task_producer = next(
+                        (p.source_name for p in var_producers if p.source_type == "task"),
+                        None,
+                    )
+
                     if task_producer:
                         available_resources_dict[var_name] = task_producer
-                    elif var_producers and var_producers[0].source_type == "inventory":
+                    elif var_producers[0].source_type == "inventory":
                         # Variables from inventory
                         available_resources_dict[var_name] = "inventory"
-                    elif var_producers:
+                    else:
                         # If no task producer, use the first producer's source name
                         available_resources_dict[var_name] = var_producers[0].source_name
             except Exception:
                 # If variable analysis fails, continue without variables
                 pass
-        
+
         # SECOND: Add resources from the error message (these are from task.provides)
         # These are the "resources" (not variables) that tasks provide
         for resource in parsed["available_resources"]:
             # Skip if we already added it as a variable
             if resource in available_resources_dict:
                 continue
-                
-            # Find which task provides this resource
-            if dependency_map:
-                for task in dependency_map.tasks:
-                    if resource in task.provides:
-                        available_resources_dict[resource] = task.name
-                        break
-                # If not found in dependency_map, it might be a variable we haven't seen yet
-                if resource not in available_resources_dict:
-                    available_resources_dict[resource] = resource
-            else:
-                # If no dependency map, just use the resource name as-is
-                available_resources_dict[resource] = resource
+
+            # Use the providing task; a resource not found in the dependency map
+            # (or with no map at all) might be a variable we haven't seen yet,
+            # so fall back to the resource name as-is
+            available_resources_dict[resource] = provider_index.get(resource, resource)
         
         # Structure as requested: message.invalid_dependency with dependency and available_resources
         # Format: message.invalid_dependency.dependency_name = {dependency: name, available_resources: {var: task, ...}}
@@ -46,13 +46,18 @@ class GitDetector:
             raise GitDetectorError(f"Error accessing git repository: {e}")
 
     def get_changed_files(
-        self, from_commit: str, to_commit: str = "HEAD"
+        self,
+        from_commit: str,
+        to_commit: str = "HEAD",
+        pathspecs: Optional[List[str]] = None,
     ) -> List[str]:
         """Get list of changed files between two commits.
 
         Args:
             from_commit: Starting commit SHA, branch name, or tag.
             to_commit: Ending commit SHA, branch name, or tag. Defaults to "HEAD".
+            pathspecs: Optional git pathspecs. When given, git itself only
+                reports changed files matching at least one of them.
 
         Returns:
             List of file paths relative to repository root that changed between commits.
@@ -61,18 +66,16 @@ class GitDetector:
             GitDetectorError: If commits are invalid or git operation fails.
         """
         try:
-            # Get the diff between commits
-            diff = self.repo.git.diff(
-                "--name-only", "--diff-filter=ACMRT", from_commit, to_commit
-            )
-
-            if not diff:
-                return []
+            # Get the diff between commits. -z separates paths with NUL and
+            # disables git's quoting of unusual file names, so the output can
+            # be split verbatim.
+            args = ["--name-only", "-z", "--diff-filter=ACMRT", from_commit, to_commit]
+            if pathspecs:
+                args.append("--")
+                args.extend(pathspecs)
+            diff = self.repo.git.diff(*args)
 
-            # Split by newlines and filter out empty strings
-            changed_files = [f.strip() for f in diff.split("\n") if f.strip()]
-
-            return changed_files
+            return [path for path in diff.split("\0") if path]
 
         except GitCommandError as e:
             raise GitDetectorError(
@@ -114,8 +117,7 @@ class GitDetector:
             GitDetectorError: If the reference is invalid or git operation fails.
         """
         try:
-            commit = self.repo.commit(ref)
-            return commit.hexsha
+            return self.repo.commit(ref).hexsha
         except (ValueError, GitCommandError, BadName) as e:
             raise GitDetectorError(
                 f"Invalid git reference '{ref}' or error accessing commit: {e}"
@@ -148,19 +150,15 @@ class GitDetector:
         """
         try:
             # Get modified, added, and renamed files
-            diff = self.repo.git.diff("--name-only", "--diff-filter=ACMRT", "HEAD")
+            diff = self.repo.git.diff("--name-only", "-z", "--diff-filter=ACMRT", "HEAD")
 
             if not diff:
                 return []
 
-            changed_files = [f.strip() for f in diff.split("\n") if f.strip()]
-
-            # Also get untracked files
-            untracked = self.repo.untracked_files
-
-            # Combine and return unique files
-            all_files = set(changed_files) | set(untracked)
-            return sorted(list(all_files))
+            # Collect unique files straight into a set, then add untracked files
+            all_files = {path for path in diff.split("\0") if path}
+            all_files.update(self.repo.untracked_files)
+            return sorted(all_files)
 
         except GitCommandError as e:
             raise GitDetectorError(f"Error getting uncommitted files: {e}")
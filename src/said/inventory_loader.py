@@ -4,12 +4,39 @@ This module provides functionality to load variables from Ansible inventory file
 group_vars, and host_vars directories.
 """
 
-import configparser
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml; use the pure-Python loader
+    from yaml import SafeLoader as _SafeLoader
+
+logger = logging.getLogger(__name__)
+
+# Discovery runs that find at least this many files parse them in a process pool
+PARALLEL_LOAD_THRESHOLD = 200
+
+# Each pool worker gets at least this many files, so starting a process is
+# always amortized over enough parsing to pay for itself
+MIN_FILES_PER_WORKER = 50
+
+# Parsed YAML files keyed by (absolute path, mtime in ns, size); editing a file
+# changes its key, so stale entries are never returned. SAID itself loads
+# from one thread, but these are public library functions, so every access
+# goes through the lock in case a caller loads from several threads.
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_YAML_CACHE_SIZE = 1024
+_YAML_CACHE_LOCK = threading.Lock()
+
 
 class InventoryLoaderError(Exception):
     """Base exception for inventory loader errors."""
@@ -17,27 +44,215 @@ class InventoryLoaderError(Exception):
     pass
 
 
-def load_yaml_file(file_path: Path) -> Dict:
-    """Load a YAML file and return its contents.
+def _yaml_cache_key(file_path: Union[str, Path]) -> Tuple[str, int, int]:
+    """Build the cache key of a YAML file.
 
     Args:
         file_path: Path to the YAML file.
 
     Returns:
-        Dictionary containing the parsed YAML content.
+        The file's absolute path, modification time in ns and size.
+
+    Raises:
+        OSError: If the file cannot be stat'ed.
+    """
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _get_cached_yaml(key: Tuple[str, int, int]) -> Optional[Dict]:
+    """Look up a parsed YAML file in the cache.
+
+    Args:
+        key: Cache key from _yaml_cache_key.
+
+    Returns:
+        The cached content, shared with the cache, or None on a miss.
+    """
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None:
+            _YAML_CACHE.move_to_end(key)
+        return cached
+
+
+def _cache_yaml(key: Tuple[str, int, int], content: Dict) -> None:
+    """Store a parsed YAML file in the cache, evicting the oldest entry if full.
+
+    Args:
+        key: Cache key from _yaml_cache_key.
+        content: Parsed content of the file.
+    """
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = content
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+
+
+def _parse_yaml_file(file_path: Union[str, Path]) -> Dict:
+    """Read and parse a YAML file without consulting the cache.
+
+    Args:
+        file_path: Path to the YAML file.
+
+    Returns:
+        Dictionary containing the parsed YAML content; empty if the document
+        is not a mapping.
 
     Raises:
         InventoryLoaderError: If the file cannot be read or parsed.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
-            return content if isinstance(content, dict) else {}
+        # Read raw bytes in one unbuffered read; libyaml decodes them itself
+        with open(file_path, "rb", buffering=0) as f:
+            content = yaml.load(f.read(), Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise InventoryLoaderError(f"Failed to parse YAML file {file_path}: {e}")
     except IOError as e:
         raise InventoryLoaderError(f"Failed to read file {file_path}: {e}")
 
+    return content if isinstance(content, dict) else {}
+
+
+def load_yaml_file(file_path: Union[str, Path]) -> Dict:
+    """Load a YAML file and return its contents.
+
+    Parsed files are cached by path, modification time and size, so loading an
+    unchanged file again skips reading and parsing it. Each call returns a new
+    top-level dictionary; nested values are shared with the cache and must not
+    be modified.
+
+    Args:
+        file_path: Path to the YAML file.
+
+    Returns:
+        Dictionary containing the parsed YAML content.
+
+    Raises:
+        InventoryLoaderError: If the file cannot be read or parsed.
+    """
+    try:
+        key = _yaml_cache_key(file_path)
+    except IOError as e:
+        raise InventoryLoaderError(f"Failed to read file {file_path}: {e}")
+
+    content = _get_cached_yaml(key)
+    if content is None:
+        content = _parse_yaml_file(file_path)
+        _cache_yaml(key, content)
+    return dict(content)
+
+
+def _list_yaml_files(directory: Union[str, Path]) -> List[str]:
+    """List the YAML files directly inside a directory with a single scan.
+
+    Matches what globbing for "*.yml" and then "*.yaml" would return: all
+    .yml files come first, then all .yaml files, each in directory order.
+
+    Args:
+        directory: Directory to scan.
+
+    Returns:
+        Paths of the YAML files found.
+    """
+    yml_files = []
+    yaml_files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".yml"):
+                yml_files.append(entry.path)
+            elif name.endswith(".yaml"):
+                yaml_files.append(entry.path)
+    yml_files.extend(yaml_files)
+    return yml_files
+
+
+def _parse_yaml_paths(paths: List[str]) -> List[Optional[Dict]]:
+    """Parse a chunk of YAML files without consulting the cache.
+
+    Args:
+        paths: Paths of the YAML files to parse.
+
+    Returns:
+        One entry per path: the parsed content, or None if the file could not
+        be read or parsed.
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append(_parse_yaml_file(path))
+        except InventoryLoaderError:
+            results.append(None)
+    return results
+
+
+def _load_yaml_files(paths: List[str]) -> Dict:
+    """Load and merge variables from YAML files, skipping unreadable ones.
+
+    Files are merged in the given order, so later files override earlier
+    ones. Files already in the cache are not parsed again; large batches of
+    the remaining files are parsed across a pool of worker processes, and
+    their results are added to the cache.
+
+    Args:
+        paths: Paths of the YAML files to load.
+
+    Returns:
+        Dictionary of the merged variables.
+    """
+    parsed: List[Optional[Dict]] = [None] * len(paths)
+    misses: List[Tuple[int, str, Tuple[str, int, int]]] = []
+    for index, path in enumerate(paths):
+        try:
+            key = _yaml_cache_key(path)
+        except OSError:
+            continue
+        cached = _get_cached_yaml(key)
+        if cached is None:
+            misses.append((index, path, key))
+        else:
+            parsed[index] = cached
+
+    miss_paths = [path for _, path, _ in misses]
+    workers = min(os.cpu_count() or 1, len(miss_paths) // MIN_FILES_PER_WORKER)
+    fresh: Optional[List[Optional[Dict]]] = None
+
+    if len(miss_paths) >= PARALLEL_LOAD_THRESHOLD and workers > 1:
+        chunk_size = -(-len(miss_paths) // workers)
+        chunks = [
+            miss_paths[start : start + chunk_size]
+            for start in range(0, len(miss_paths), chunk_size)
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                fresh = [
+                    content
+                    for chunk in executor.map(_parse_yaml_paths, chunks)
+                    for content in chunk
+                ]
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (e.g. restricted sandboxes);
+            # parsing serially gives the same result
+            fresh = None
+
+    if fresh is None:
+        fresh = _parse_yaml_paths(miss_paths)
+
+    for (index, _, key), content in zip(misses, fresh):
+        if content is not None:
+            _cache_yaml(key, content)
+            parsed[index] = content
+
+    variables = {}
+    for path, content in zip(paths, parsed):
+        if content is None:
+            logger.debug("Skipping YAML file that could not be loaded: %s", path)
+        else:
+            variables.update(content)
+    return variables
+
 
 def load_group_vars(group_vars_path: Union[str, Path]) -> Dict:
     """Load variables from a group_vars file or directory.
@@ -63,17 +278,8 @@ def load_group_vars(group_vars_path: Union[str, Path]) -> Dict:
         if group_vars_path.suffix in [".yml", ".yaml"]:
             variables.update(load_yaml_file(group_vars_path))
     elif group_vars_path.is_dir():
-        # Directory - load all YAML files
-        for var_file in group_vars_path.glob("*.yml"):
-            try:
-                variables.update(load_yaml_file(var_file))
-            except InventoryLoaderError:
-                pass  # Skip files that can't be parsed
-        for var_file in group_vars_path.glob("*.yaml"):
-            try:
-                variables.update(load_yaml_file(var_file))
-            except InventoryLoaderError:
-                pass
+        # Directory - load all YAML files, skipping ones that can't be parsed
+        variables.update(_load_yaml_files(_list_yaml_files(group_vars_path)))
 
     return variables
 
@@ -102,17 +308,8 @@ def load_host_vars(host_vars_path: Union[str, Path]) -> Dict:
         if host_vars_path.suffix in [".yml", ".yaml"]:
             variables.update(load_yaml_file(host_vars_path))
     elif host_vars_path.is_dir():
-        # Directory - load all YAML files
-        for var_file in host_vars_path.glob("*.yml"):
-            try:
-                variables.update(load_yaml_file(var_file))
-            except InventoryLoaderError:
-                pass
-        for var_file in host_vars_path.glob("*.yaml"):
-            try:
-                variables.update(load_yaml_file(var_file))
-            except InventoryLoaderError:
-                pass
+        # Directory - load all YAML files, skipping ones that can't be parsed
+        variables.update(_load_yaml_files(_list_yaml_files(host_vars_path)))
 
     return variables
 
@@ -120,7 +317,8 @@ def load_host_vars(host_vars_path: Union[str, Path]) -> Dict:
 def load_inventory_variables(inventory_path: Union[str, Path]) -> Dict:
     """Load variables from an Ansible inventory file.
 
-    Supports both YAML and INI format inventory files.
+    Variables are read from YAML inventories; any other inventory file
+    (e.g. INI format) yields no variables.
 
     Args:
         inventory_path: Path to the inventory file.
@@ -152,137 +350,133 @@ def load_inventory_variables(inventory_path: Union[str, Path]) -> Dict:
                         variables.update(group_data["vars"])
         except InventoryLoaderError:
             pass
-    else:
-        # Try INI format
-        try:
-            config = configparser.ConfigParser(allow_no_value=True)
-            config.read(inventory_path)
-            # INI format doesn't typically have vars, but we can extract host/group info
-            # Variables are usually in group_vars/host_vars
-            pass
-        except Exception:
-            pass
+    # INI inventories are not read: they don't typically define vars, which
+    # usually live in group_vars/host_vars
 
     return variables
 
 
-def discover_group_vars(inventory_dir: Optional[Path] = None) -> Dict:
-    """Auto-discover and load group_vars from common locations.
+def _vars_search_dirs(kind: str, inventory_dir: Optional[Path] = None) -> List[Path]:
+    """List the existing directories searched for group_vars or host_vars.
 
-    Searches for group_vars in:
-    - inventory_dir/group_vars/
-    - inventory_dir/../group_vars/
-    - ./group_vars/
-    - ./inventories/*/group_vars/
+    Paths that resolve to the same directory (e.g. "group_vars" and
+    "inventory_dir/group_vars" when run from inventory_dir) are searched only
+    once, at the position of their last occurrence so later locations keep
+    their precedence.
 
     Args:
+        kind: Directory name to search for, "group_vars" or "host_vars".
         inventory_dir: Optional inventory directory to search from.
 
     Returns:
-        Dictionary of all discovered group variables.
+        Existing directories to search, in load order.
     """
-    variables = {}
     search_paths = []
 
     if inventory_dir:
         inventory_dir = Path(inventory_dir)
         search_paths.extend([
-            inventory_dir / "group_vars",
-            inventory_dir.parent / "group_vars",
+            inventory_dir / kind,
+            inventory_dir.parent / kind,
         ])
 
     # Add common locations
     search_paths.extend([
-        Path("group_vars"),
-        Path("inventories") / "group_vars",
+        Path(kind),
+        Path("inventories") / kind,
     ])
 
     # Search in inventory subdirectories
     inventories_dir = Path("inventories")
-    if inventories_dir.exists():
+    if inventories_dir.is_dir():
         for inv_dir in inventories_dir.iterdir():
-            if inv_dir.is_dir():
-                group_vars_dir = inv_dir / "group_vars"
-                if group_vars_dir.exists():
-                    search_paths.append(group_vars_dir)
+            search_paths.append(inv_dir / kind)
 
-    # Load from all found locations
+    unique_dirs: Dict[Path, Path] = {}
     for search_path in search_paths:
-        if search_path.exists() and search_path.is_dir():
-            for var_file in search_path.glob("*.yml"):
-                try:
-                    variables.update(load_yaml_file(var_file))
-                except InventoryLoaderError:
-                    pass
-            for var_file in search_path.glob("*.yaml"):
-                try:
-                    variables.update(load_yaml_file(var_file))
-                except InventoryLoaderError:
-                    pass
-
-    return variables
+        if search_path.is_dir():
+            resolved = search_path.resolve()
+            unique_dirs.pop(resolved, None)
+            unique_dirs[resolved] = search_path
 
+    return list(unique_dirs.values())
 
-def discover_host_vars(inventory_dir: Optional[Path] = None) -> Dict:
-    """Auto-discover and load host_vars from common locations.
 
-    Similar to discover_group_vars but for host_vars.
+def _find_group_vars_files(inventory_dir: Optional[Path] = None) -> List[str]:
+    """Find the group_vars files discover_group_vars loads, in load order.
 
     Args:
         inventory_dir: Optional inventory directory to search from.
 
     Returns:
-        Dictionary of all discovered host variables.
+        Paths of the discovered group_vars YAML files.
     """
-    variables = {}
-    search_paths = []
+    files = []
+    for search_path in _vars_search_dirs("group_vars", inventory_dir):
+        files.extend(_list_yaml_files(search_path))
 
-    if inventory_dir:
-        inventory_dir = Path(inventory_dir)
-        search_paths.extend([
-            inventory_dir / "host_vars",
-            inventory_dir.parent / "host_vars",
-        ])
+    return files
 
-    # Add common locations
-    search_paths.extend([
-        Path("host_vars"),
-        Path("inventories") / "host_vars",
-    ])
 
-    # Search in inventory subdirectories
-    inventories_dir = Path("inventories")
-    if inventories_dir.exists():
-        for inv_dir in inventories_dir.iterdir():
-            if inv_dir.is_dir():
-                host_vars_dir = inv_dir / "host_vars"
-                if host_vars_dir.exists():
-                    search_paths.append(host_vars_dir)
+def _find_host_vars_files(inventory_dir: Optional[Path] = None) -> List[str]:
+    """Find the host_vars files discover_host_vars loads, in load order.
 
-    # Load from all found locations
-    for search_path in search_paths:
-        if search_path.exists() and search_path.is_dir():
-            for host_dir in search_path.iterdir():
-                if host_dir.is_dir():
+    Args:
+        inventory_dir: Optional inventory directory to search from.
+
+    Returns:
+        Paths of the discovered host_vars YAML files.
+    """
+    files = []
+
+    # Host entries are classified from the directory listing itself, which
+    # avoids a stat call per host on large host_vars trees.
+    for search_path in _vars_search_dirs("host_vars", inventory_dir):
+        with os.scandir(search_path) as host_entries:
+            for host_entry in host_entries:
+                if host_entry.is_dir():
                     # Each host has its own directory
-                    for var_file in host_dir.glob("*.yml"):
-                        try:
-                            variables.update(load_yaml_file(var_file))
-                        except InventoryLoaderError:
-                            pass
-                    for var_file in host_dir.glob("*.yaml"):
-                        try:
-                            variables.update(load_yaml_file(var_file))
-                        except InventoryLoaderError:
-                            pass
-                elif host_dir.is_file() and host_dir.suffix in [".yml", ".yaml"]:
+                    files.extend(_list_yaml_files(host_entry.path))
+                elif (
+                    host_entry.is_file()
+                    and os.path.splitext(host_entry.name)[1] in (".yml", ".yaml")
+                ):
                     # Single host var file
-                    try:
-                        variables.update(load_yaml_file(host_dir))
-                    except InventoryLoaderError:
-                        pass
+                    files.append(host_entry.path)
 
-    return variables
+    return files
+
+
+def discover_group_vars(inventory_dir: Optional[Path] = None) -> Dict:
+    """Auto-discover and load group_vars from common locations.
+
+    Searches for group_vars in:
+    - inventory_dir/group_vars/
+    - inventory_dir/../group_vars/
+    - ./group_vars/
+    - ./inventories/*/group_vars/
+
+    Args:
+        inventory_dir: Optional inventory directory to search from.
+
+    Returns:
+        Dictionary of all discovered group variables.
+    """
+    return _load_yaml_files(_find_group_vars_files(inventory_dir))
+
+
+def discover_host_vars(inventory_dir: Optional[Path] = None) -> Dict:
+    """Auto-discover and load host_vars from common locations.
+
+    Similar to discover_group_vars but for host_vars.
+
+    Args:
+        inventory_dir: Optional inventory directory to search from.
+
+    Returns:
+        Dictionary of all discovered host variables.
+    """
+    return _load_yaml_files(_find_host_vars_files(inventory_dir))
 
 
 def load_all_variables(
@@ -334,16 +528,19 @@ def load_all_variables(
         if inventory_path:
             inventory_dir = Path(inventory_path).parent
 
+        # Find group_vars and host_vars files first so they are all parsed in
+        # one batch; group_vars load before (and are overridden by) host_vars
+        discovered_files = []
         try:
-            discovered_group_vars = discover_group_vars(inventory_dir)
-            all_variables.update(discovered_group_vars)
+            discovered_files.extend(_find_group_vars_files(inventory_dir))
         except Exception:
             pass
 
         try:
-            discovered_host_vars = discover_host_vars(inventory_dir)
-            all_variables.update(discovered_host_vars)
+            discovered_files.extend(_find_host_vars_files(inventory_dir))
         except Exception:
             pass
 
+        all_variables.update(_load_yaml_files(discovered_files))
+
     return all_variables
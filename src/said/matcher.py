@@ -5,11 +5,28 @@ watch_files patterns, supporting both exact matches and glob patterns.
 """
 
 import fnmatch
+import os
+import re
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
 
 from said.schema import DependencyMap, TaskMetadata
 
+# Diffs with at least this many files are matched in a process pool
+PARALLEL_MATCH_THRESHOLD = 500
+
+# Characters that give a watch_files pattern glob meaning
+_GLOB_CHARS = frozenset("*?[")
+
+# "*.ext" patterns, which match exactly the paths ending in ".ext"
+_EXTENSION_PATTERN_RE = re.compile(r"\*(\.[^*?\[/.]+)")
+
+# Dependency map installed in each pool worker by _init_match_worker
+_worker_dependency_map: Optional[DependencyMap] = None
+
 
 class MatcherError(Exception):
     """Base exception for matcher errors."""
@@ -29,16 +46,7 @@ def match_file_to_tasks(
     Returns:
         Set of task names that match this file.
     """
-    matched_tasks = set()
-    file_path_obj = Path(file_path)
-
-    for task in dependency_map.tasks:
-        for pattern in task.watch_files:
-            if _matches_pattern(file_path_obj, pattern):
-                matched_tasks.add(task.name)
-                break  # Task matches, no need to check other patterns
-
-    return matched_tasks
+    return _compiled_patterns(dependency_map).match(file_path)
 
 
 def match_files_to_tasks(
@@ -53,73 +61,313 @@ def match_files_to_tasks(
     Returns:
         Set of all task names that match any of the provided files.
     """
+    workers = os.cpu_count() or 1
+    if len(file_paths) >= PARALLEL_MATCH_THRESHOLD and workers > 1:
+        try:
+            return _match_files_parallel(file_paths, dependency_map, workers)
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (e.g. restricted sandboxes);
+            # matching serially gives the same result
+            pass
+
+    return _match_chunk(file_paths, dependency_map)
+
+
+def _match_chunk(
+    file_paths: List[str], dependency_map: Optional[DependencyMap] = None
+) -> Set[str]:
+    """Match a chunk of file paths to tasks.
+
+    Args:
+        file_paths: File paths to match.
+        dependency_map: The dependency map to match against. If None, the map
+            installed in the current pool worker is used.
+
+    Returns:
+        Set of all task names that match any of the provided files.
+    """
+    if dependency_map is None:
+        dependency_map = _worker_dependency_map
+
+    patterns = _compiled_patterns(dependency_map)
     all_matched_tasks = set()
 
+    all_tasks_count = len(patterns.watching_tasks)
+
     for file_path in file_paths:
-        matched = match_file_to_tasks(file_path, dependency_map)
+        matched = patterns.match(file_path)
         all_matched_tasks.update(matched)
+        if len(all_matched_tasks) == all_tasks_count:
+            # Every task that can match already has; the rest cannot add any
+            break
 
     return all_matched_tasks
 
 
-def _matches_pattern(file_path: Path, pattern: str) -> bool:
-    """Check if a file path matches a pattern.
+def _init_match_worker(dependency_map: DependencyMap) -> None:
+    """Install the dependency map in a pool worker so it is pickled only once."""
+    global _worker_dependency_map
+    _worker_dependency_map = dependency_map
+
+
+def _match_files_parallel(
+    file_paths: List[str], dependency_map: DependencyMap, workers: int
+) -> Set[str]:
+    """Match file paths to tasks across a pool of worker processes.
+
+    Args:
+        file_paths: File paths to match.
+        dependency_map: The dependency map to match against.
+        workers: Number of worker processes (and chunks) to use.
+
+    Returns:
+        Set of all task names that match any of the provided files.
+    """
+    chunk_size = -(-len(file_paths) // workers)
+    chunks = [
+        file_paths[start : start + chunk_size]
+        for start in range(0, len(file_paths), chunk_size)
+    ]
+
+    all_matched_tasks = set()
+    with ProcessPoolExecutor(
+        max_workers=len(chunks),
+        initializer=_init_match_worker,
+        initargs=(dependency_map,),
+    ) as executor:
+        for matched in executor.map(_match_chunk, chunks):
+            all_matched_tasks.update(matched)
 
-    Supports:
-    - Exact matches: "file.yml" matches only "file.yml"
-    - Glob patterns: "*.yml" matches any .yml file
-    - Path patterns: "templates/*.j2" matches .j2 files in templates/
-    - Relative paths: Both file and pattern are normalized
+    return all_matched_tasks
+
+
+def _path_forms(file_path: str) -> Tuple[str, List[str]]:
+    """Normalize a file path and list the forms patterns are matched against.
 
     Args:
-        file_path: Path object for the file to check.
-        pattern: Pattern to match against (supports glob syntax).
+        file_path: Path to the file (can be relative or absolute).
+
+    Returns:
+        The normalized POSIX path, and a list of the full path followed by
+        every trailing run of path segments, ending with the filename. After
+        the full path, each form has exactly one separator fewer than the
+        one before it.
+    """
+    if (
+        file_path
+        and file_path[0] != "/"
+        and file_path[-1] != "/"
+        and "//" not in file_path
+        and "./" not in file_path
+        and "\\" not in file_path
+        and file_path != "."
+        and not file_path.endswith("/.")
+    ):
+        # Already a normalized relative path (as git reports them), so the
+        # forms can be sliced out of the string without building Path objects
+        candidates = [file_path]
+        separator = file_path.find("/")
+        while separator != -1:
+            candidates.append(file_path[separator + 1 :])
+            separator = file_path.find("/", separator + 1)
+        return file_path, candidates
+
+    path = Path(file_path)
+    path_str = path.as_posix()
+    parts = path.parts
+    candidates = [path_str]
+    candidates.extend("/".join(parts[i:]) for i in range(1, len(parts)))
+    if candidates[-1] != path.name:
+        candidates.append(path.name)
+    return path_str, candidates
+
+
+def _translate_pattern(pattern: str) -> str:
+    """Translate a watch_files glob pattern to a regular expression.
+
+    Follows fnmatch, except that a "**/" segment matches zero or more whole
+    directories, so "roles/**/*.yml" matches "roles/main.yml" as well as
+    "roles/web/tasks/main.yml".
+
+    Args:
+        pattern: The normalized glob pattern.
+
+    Returns:
+        Regular expression source that matches the whole string.
+    """
+    if "**/" not in pattern:
+        return fnmatch.translate(pattern)
+
+    # fnmatch.translate wraps its result as "(?s:...)\Z"; join the inner parts
+    inner = [fnmatch.translate(part)[4:-3] for part in pattern.split("**/")]
+    return "(?s:" + "(?:.*/)?".join(inner) + ")\\Z"
+
+
+def _min_separators(pattern: str) -> int:
+    """Count the separators every path matched by a glob pattern contains.
+
+    Args:
+        pattern: The normalized glob pattern.
+
+    Returns:
+        The number of "/" characters a matching path form has at least.
+    """
+    if "[" in pattern:
+        # A bracket expression may or may not match "/", so assume nothing
+        return 0
+    # "**/" matches zero directories, so its separator is optional
+    return pattern.replace("**/", "").count("/")
+
+
+class _CompiledPatterns:
+    """The watch_files patterns of a dependency map, compiled for matching.
+
+    A file matches a pattern when:
+    - Exact match: the normalized path equals the pattern
+    - Glob match: the pattern matches the full path, e.g. "*.yml"
+    - Suffix match: the pattern matches any trailing part of the path, so
+      "templates/*.j2" matches "roles/web/templates/nginx.conf.j2" and
+      "nginx.conf.j2" matches "some/deep/path/nginx.conf.j2"
+    - Recursive match: "**/" matches zero or more directories, so
+      "roles/**/*.yml" matches "roles/main.yml"
+
+    Patterns without glob characters and bare "*.ext" patterns are indexed in
+    dictionaries, so a file probes them with one lookup per path form instead
+    of testing every pattern. The remaining patterns are translated to regular
+    expressions once: a task's patterns are joined into a single alternation,
+    and all of them into another one that rejects files no such pattern
+    matches with one regex call.
+    """
+
+    __slots__ = (
+        "watching_tasks",
+        "_exact",
+        "_literal",
+        "_extension",
+        "_task_regexes",
+        "_any_regex",
+    )
+
+    def __init__(self, watch_files: Tuple[Tuple[str, Tuple[str, ...]], ...]):
+        """Compile the watch_files patterns of every task.
+
+        Args:
+            watch_files: Pairs of task name and that task's watch_files patterns.
+        """
+        # Tasks with at least one pattern; no file can match any other task
+        self.watching_tasks: FrozenSet[str] = frozenset(
+            task_name for task_name, patterns in watch_files if patterns
+        )
+        self._exact: Dict[str, List[str]] = {}
+        self._literal: Dict[str, List[str]] = {}
+        self._extension: Dict[str, List[str]] = {}
+        self._task_regexes: List[Tuple[str, Pattern[str], int]] = []
+        all_translated: Dict[str, None] = {}
+
+        for task_name, patterns in watch_files:
+            translated = []
+            min_separators = None
+            for pattern in patterns:
+                # Normalize patterns to handle different separators
+                pattern_str = Path(pattern).as_posix()
+                if _GLOB_CHARS.isdisjoint(pattern_str):
+                    # Matches only a path form equal to the pattern
+                    self._literal.setdefault(pattern_str, []).append(task_name)
+                    continue
+
+                extension = _EXTENSION_PATTERN_RE.fullmatch(pattern_str)
+                if extension:
+                    self._extension.setdefault(extension.group(1), []).append(task_name)
+                    continue
+
+                self._exact.setdefault(pattern_str, []).append(task_name)
+                translated.append(_translate_pattern(pattern_str))
+                separators = _min_separators(pattern_str)
+                if min_separators is None or separators < min_separators:
+                    min_separators = separators
+            if translated:
+                self._task_regexes.append(
+                    (task_name, re.compile("|".join(translated)), min_separators)
+                )
+                all_translated.update(dict.fromkeys(translated))
+
+        self._any_regex: Optional[Pattern[str]] = (
+            re.compile("|".join(all_translated)) if all_translated else None
+        )
+
+    def match(self, file_path: str) -> Set[str]:
+        """Match a single file path to the tasks that watch it.
+
+        Args:
+            file_path: Path to the file to match (can be relative or absolute).
+
+        Returns:
+            Set of task names that match this file.
+        """
+        path_str, candidates = _path_forms(file_path)
+
+        matched_tasks = set(self._exact.get(path_str, ()))
+
+        literal = self._literal
+        if literal:
+            for candidate in candidates:
+                if candidate in literal:
+                    matched_tasks.update(literal[candidate])
+
+        # Every path form is a suffix of the full path, so "*.ext" matches
+        # exactly when the full path ends with the extension
+        dot = path_str.rfind(".")
+        if dot != -1 and self._extension:
+            matched_tasks.update(self._extension.get(path_str[dot:], ()))
+
+        any_regex = self._any_regex
+        if any_regex is None or not any(any_regex.match(c) for c in candidates):
+            return matched_tasks
+
+        # Path forms with fewer separators than a task's patterns require
+        # cannot match them, and those forms come last, so only a prefix of
+        # the forms is tried (the full path is always kept)
+        form_count = len(candidates)
+        for task_name, regex, min_separators in self._task_regexes:
+            if task_name in matched_tasks:
+                continue
+            forms = candidates[: max(1, form_count - min_separators)]
+            if any(regex.match(c) for c in forms):
+                matched_tasks.add(task_name)
+
+        return matched_tasks
+
+
+@lru_cache(maxsize=16)
+def _compile_watch_files(
+    watch_files: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> _CompiledPatterns:
+    """Compile a set of watch_files patterns, reusing earlier compilations."""
+    return _CompiledPatterns(watch_files)
+
+
+def _compiled_patterns(dependency_map: DependencyMap) -> _CompiledPatterns:
+    """Get the compiled watch_files patterns of a dependency map.
+
+    The compiled patterns are attached to the dependency map on first use, so
+    later matches against it skip even the cache lookup. Like the map's
+    task_names, they assume the map is not modified once loaded. Separately
+    loaded but identical maps share one compilation through a cache keyed by
+    the tasks' names and patterns.
+
+    Args:
+        dependency_map: The dependency map containing tasks with watch_files.
 
     Returns:
-        True if the file matches the pattern, False otherwise.
+        The compiled patterns.
     """
-    # Normalize paths to handle different separators
-    file_path_str = str(file_path.as_posix())
-    pattern_str = str(Path(pattern).as_posix())
-
-    # Check for exact match first
-    if file_path_str == pattern_str:
-        return True
-
-    # Check if pattern matches the full path
-    if fnmatch.fnmatch(file_path_str, pattern_str):
-        return True
-
-    # Check if pattern matches just the filename
-    if fnmatch.fnmatch(file_path.name, pattern_str):
-        return True
-
-    # Check if pattern matches relative path from common base
-    # This handles cases like "templates/nginx.conf.j2" matching "templates/*.j2"
-    # Try matching against different path segments
-    path_parts = file_path.parts
-    pattern_parts = Path(pattern_str).parts
-
-    # If pattern has multiple parts, try matching path segments
-    if len(pattern_parts) > 1:
-        # Try to match from the end (most specific)
-        if len(path_parts) >= len(pattern_parts):
-            # Get the last N parts of the path
-            path_suffix = Path(*path_parts[-len(pattern_parts) :])
-            if fnmatch.fnmatch(str(path_suffix.as_posix()), pattern_str):
-                return True
-
-    # Try matching any suffix of the path against the pattern
-    # This handles cases where pattern is "nginx.conf.j2" and file is
-    # "some/deep/path/nginx.conf.j2"
-    for i in range(len(path_parts)):
-        path_suffix = Path(*path_parts[i:])
-        if fnmatch.fnmatch(str(path_suffix.as_posix()), pattern_str):
-            return True
-        if fnmatch.fnmatch(path_suffix.name, pattern_str):
-            return True
-
-    return False
+    patterns = getattr(dependency_map, "_compiled_watch_patterns", None)
+    if patterns is None:
+        patterns = _compile_watch_files(
+            tuple((task.name, tuple(task.watch_files)) for task in dependency_map.tasks)
+        )
+        dependency_map._compiled_watch_patterns = patterns
+    return patterns
 
 
 def get_tasks_for_changed_files(
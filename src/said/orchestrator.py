@@ -4,8 +4,10 @@ This module provides functionality to generate Ansible commands with --tags
 based on resolved task dependencies.
 """
 
+import io
 import shlex
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
 
 class OrchestratorError(Exception):
@@ -14,6 +16,39 @@ class OrchestratorError(Exception):
     pass
 
 
+@lru_cache(maxsize=64)
+def _tags_argument(task_names: Tuple[str, ...]) -> str:
+    """Build the --tags value for a sequence of task names.
+
+    Memoized because the same tasks are often rendered more than once, e.g. a
+    dry run followed by the real run.
+
+    Args:
+        task_names: Task names to execute (in execution order).
+
+    Returns:
+        Comma-separated Ansible tags.
+    """
+    # Extract task name parts for tags
+    # Task names are in format like "role/traefik/tasks/main:Task Name"
+    # We need to extract just the task name part (after the colon) for Ansible tags
+    # If there's no colon, use the full name
+    ansible_tags = []
+    for task_name in task_names:
+        # Extract the task name part (after the last colon)
+        if ":" in task_name:
+            # Get the part after the last colon
+            tag_name = task_name.split(":", 1)[-1]
+        else:
+            # No colon, use the full name
+            tag_name = task_name
+        ansible_tags.append(tag_name)
+
+    # In Ansible, tags are specified as --tags "tag1,tag2,tag3"
+    # Use the extracted task names as tags
+    return ",".join(ansible_tags)
+
+
 class AnsibleOrchestrator:
     """Generates Ansible commands with appropriate tags."""
 
@@ -62,26 +97,8 @@ class AnsibleOrchestrator:
         # Add playbook path
         cmd.append(self.playbook_path)
 
-        # Extract task name parts for tags
-        # Task names are in format like "role/traefik/tasks/main:Task Name"
-        # We need to extract just the task name part (after the colon) for Ansible tags
-        # If there's no colon, use the full name
-        ansible_tags = []
-        for task_name in task_names:
-            # Extract the task name part (after the last colon)
-            if ":" in task_name:
-                # Get the part after the last colon
-                tag_name = task_name.split(":", 1)[-1]
-            else:
-                # No colon, use the full name
-                tag_name = task_name
-            ansible_tags.append(tag_name)
-        
         # Add tags
-        # In Ansible, tags are specified as --tags "tag1,tag2,tag3"
-        # Use the extracted task names as tags
-        tags_str = ",".join(ansible_tags)
-        cmd.extend(["--tags", tags_str])
+        cmd.extend(["--tags", _tags_argument(tuple(task_names))])
 
         # Add dry-run flag if requested
         if dry_run:
@@ -108,6 +125,18 @@ class AnsibleOrchestrator:
             OrchestratorError: If task_names is empty or invalid.
         """
         cmd = self.generate_command(task_names, dry_run=dry_run)
+        return self.format_command(cmd)
+
+    @staticmethod
+    def format_command(cmd: List[str]) -> str:
+        """Shell-escape an already generated command.
+
+        Args:
+            cmd: Command arguments, as returned by generate_command.
+
+        Returns:
+            Shell-escaped command string.
+        """
         return " ".join(shlex.quote(arg) for arg in cmd)
 
     def format_execution_plan(
@@ -128,33 +157,38 @@ class AnsibleOrchestrator:
         Returns:
             Formatted string describing the execution plan.
         """
-        lines = []
-        lines.append("=" * 70)
-        lines.append("SAID Execution Plan")
-        lines.append("=" * 70)
+        # Built once so every per-task membership test below is a hash lookup,
+        # even if the caller passed matched tasks as a list
+        matched_set = frozenset(matched_tasks) if matched_tasks else frozenset()
+
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 70 + "\n")
+        w("SAID Execution Plan\n")
+        w("=" * 70 + "\n")
 
         if changed_files:
-            lines.append("\n📝 Changed Files:")
+            w("\n📝 Changed Files:\n")
             for file_path in sorted(changed_files):
-                lines.append(f"   • {file_path}")
+                w(f"   • {file_path}\n")
 
-        if matched_tasks and matched_tasks != set(task_names):
-            lines.append(f"\n🎯 Initially Matched Tasks ({len(matched_tasks)}):")
-            for task_name in sorted(matched_tasks):
-                lines.append(f"   • {task_name}")
+        if matched_set and matched_set != set(task_names):
+            w(f"\n🎯 Initially Matched Tasks ({len(matched_set)}):\n")
+            for task_name in sorted(matched_set):
+                w(f"   • {task_name}\n")
 
         if task_names:
-            lines.append(f"\n⚙️  Tasks to Execute ({len(task_names)}):")
+            w(f"\n⚙️  Tasks to Execute ({len(task_names)}):\n")
             for i, task_name in enumerate(task_names, start=1):
-                marker = "→" if task_name in (matched_tasks or set()) else " "
-                lines.append(f"   {i:2d}. {marker} {task_name}")
+                marker = "→" if task_name in matched_set else " "
+                w(f"   {i:2d}. {marker} {task_name}\n")
 
         if command_string:
-            lines.append("\n📋 Generated Ansible Command:")
-            lines.append(f"   {command_string}")
+            w("\n📋 Generated Ansible Command:\n")
+            w(f"   {command_string}\n")
 
-        lines.append("\n" + "=" * 70)
-        return "\n".join(lines)
+        w("\n" + "=" * 70)
+        return buf.getvalue()
 
     def format_json_output(
         self,
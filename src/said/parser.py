@@ -5,15 +5,52 @@ extract task metadata, supporting both standalone manifest files and
 inline metadata within Ansible playbooks.
 """
 
+import json
+import mmap
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
 
 from said.schema import DependencyMap, SchemaError, TaskMetadata, validate_dependency_map
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml; use the pure-Python loader
+    from yaml import SafeLoader as _SafeLoader
+
+# Marker that starts an inline metadata comment, as text and as raw bytes
+_SAID_MARKER = "# SAID:"
+_SAID_MARKER_BYTES = _SAID_MARKER.encode()
+
+# A "# SAID:" metadata comment, optionally indented; group 1 is the metadata.
+# Whitespace other than newlines is allowed before the marker, like str.strip()
+_SAID_LINE_RE = re.compile(r"^[^\S\n]*" + re.escape(_SAID_MARKER) + r"(.*)", re.MULTILINE)
+
+# Common Ansible playbook file extensions
+_PLAYBOOK_EXTENSIONS = frozenset({".yml", ".yaml"})
+
+# Playbook directories with at least this many playbooks are parsed in a process pool
+PARALLEL_PARSE_THRESHOLD = 200
+
+# Each pool worker gets at least this many playbooks, so starting a process is
+# always amortized over enough parsing to pay for itself
+MIN_PLAYBOOKS_PER_WORKER = 50
+
+# Playbooks at least this large are memory-mapped rather than read into memory
+MMAP_PLAYBOOK_THRESHOLD = 64 * 1024
+
+# Inline metadata of parsed playbooks keyed by (absolute path, mtime in ns,
+# size); editing a playbook changes its key, so stale entries are never returned
+_playbook_metadata_cache: "OrderedDict[Tuple[str, int, int], List[Dict]]" = OrderedDict()
+_PLAYBOOK_CACHE_SIZE = 1024
+
 
 class ParserError(Exception):
     """Base exception for parser errors."""
@@ -33,17 +70,19 @@ def parse_yaml_file(file_path: Union[str, Path]) -> Dict:
     Raises:
         ParserError: If the file cannot be read or parsed.
     """
-    file_path = Path(file_path)
+    file_path = file_path if isinstance(file_path, Path) else Path(file_path)
 
-    if not file_path.exists():
+    # Opened directly rather than checked first; the open call reports a
+    # missing file or a directory itself
+    try:
+        # Binary mode: libyaml decodes the raw bytes itself, and reading from
+        # the file object keeps its name in error marks
+        with open(file_path, "rb") as f:
+            content = yaml.load(f, Loader=_SafeLoader)
+    except FileNotFoundError:
         raise ParserError(f"Dependency map file not found: {file_path}")
-
-    if not file_path.is_file():
+    except IsADirectoryError:
         raise ParserError(f"Path is not a file: {file_path}")
-
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
     except yaml.YAMLError as e:
         raise ParserError(f"Failed to parse YAML file {file_path}: {e}")
     except IOError as e:
@@ -60,25 +99,49 @@ def parse_yaml_file(file_path: Union[str, Path]) -> Dict:
     return content
 
 
-# Cache for parsed dependency maps (keyed by file path and mtime)
-_dependency_map_cache: Dict[tuple, DependencyMap] = {}
+# Cache for parsed dependency maps (keyed by file path and stat), least
+# recently used first
+_dependency_map_cache: "OrderedDict[tuple, DependencyMap]" = OrderedDict()
+_DEPENDENCY_MAP_CACHE_SIZE = 100
+
+
+@lru_cache(maxsize=1024)
+def _resolve(absolute_path: str) -> str:
+    """Resolve symlinks in an absolute path, memoized.
+
+    Resolving lstat()s every path component, and the same dependency map
+    paths are looked up on every parse. Taking absolute paths only keeps
+    the memoized result independent of the working directory.
+
+    Args:
+        absolute_path: Absolute path to resolve.
+
+    Returns:
+        The canonical path.
+    """
+    return os.path.realpath(absolute_path)
 
 
 def _get_cache_key(file_path: Path) -> tuple:
-    """Generate cache key from file path and modification time.
+    """Generate cache key from file path, modification time, size and inode.
+
+    Size and inode come from the same stat call as the mtime and catch a
+    rewrite (or a file replaced by rename) within the filesystem's mtime
+    granularity.
 
     Args:
         file_path: Path to the file.
 
     Returns:
-        Tuple of (absolute_path, mtime) for use as cache key.
+        Tuple of (absolute_path, mtime_ns, size, inode) for use as cache key.
     """
+    resolved = _resolve(os.path.abspath(file_path))
     try:
         stat = file_path.stat()
-        return (str(file_path.resolve()), stat.st_mtime)
+        return (resolved, stat.st_mtime_ns, stat.st_size, stat.st_ino)
     except OSError:
         # If we can't stat the file, use path only (no caching)
-        return (str(file_path.resolve()), None)
+        return (resolved, None, None, None)
 
 
 def parse_dependency_map(file_path: Union[str, Path], use_cache: bool = True) -> DependencyMap:
@@ -99,12 +162,13 @@ def parse_dependency_map(file_path: Union[str, Path], use_cache: bool = True) ->
         ParserError: If the file cannot be parsed or is invalid.
         SchemaError: If the dependency map structure is invalid.
     """
-    file_path = Path(file_path)
+    file_path = file_path if isinstance(file_path, Path) else Path(file_path)
     
     # Check cache if enabled
     if use_cache:
         cache_key = _get_cache_key(file_path)
         if cache_key[1] is not None and cache_key in _dependency_map_cache:
+            _dependency_map_cache.move_to_end(cache_key)
             return _dependency_map_cache[cache_key]
     
     try:
@@ -124,10 +188,9 @@ def parse_dependency_map(file_path: Union[str, Path], use_cache: bool = True) ->
             if use_cache and cache_key[1] is not None:
                 _dependency_map_cache[cache_key] = dependency_map
                 # Limit cache size to prevent memory issues
-                if len(_dependency_map_cache) > 100:
-                    # Remove oldest entries (simple FIFO)
-                    oldest_key = next(iter(_dependency_map_cache))
-                    del _dependency_map_cache[oldest_key]
+                if len(_dependency_map_cache) > _DEPENDENCY_MAP_CACHE_SIZE:
+                    # Remove the least recently used entry
+                    _dependency_map_cache.popitem(last=False)
             
             return dependency_map
         except SchemaError as e:
@@ -141,11 +204,25 @@ def parse_dependency_map(file_path: Union[str, Path], use_cache: bool = True) ->
 
 
 def clear_dependency_map_cache():
-    """Clear the dependency map cache.
+    """Clear the dependency map cache, including cached playbook metadata.
 
     Useful for testing or when you want to force re-parsing of files.
     """
     _dependency_map_cache.clear()
+    _playbook_metadata_cache.clear()
+
+
+def _line_number(content: str, match: "re.Match[str]") -> int:
+    """Return the 1-based line number of a match, for error messages.
+
+    Args:
+        content: The string that was searched.
+        match: A match found in content.
+
+    Returns:
+        Line number the match starts on.
+    """
+    return content.count("\n", 0, match.start()) + 1
 
 
 def parse_inline_metadata(playbook_content: str) -> List[Dict]:
@@ -164,37 +241,225 @@ def parse_inline_metadata(playbook_content: str) -> List[Dict]:
     Raises:
         ParserError: If metadata cannot be parsed.
     """
-    tasks = []
-    lines = playbook_content.split("\n")
+    # Most playbooks carry no metadata at all
+    if _SAID_MARKER not in playbook_content:
+        return []
 
-    for line_num, line in enumerate(lines, start=1):
-        line = line.strip()
+    tasks = []
 
-        # Look for SAID metadata comments
-        if line.startswith("# SAID:"):
-            metadata_str = line[7:].strip()  # Remove "# SAID:" prefix
+    for match in _SAID_LINE_RE.finditer(playbook_content):
+        metadata_str = match.group(1).strip()
 
+        try:
+            # The documented format is a JSON object, which the json
+            # module decodes far faster; anything else is parsed as YAML
+            # (which is a superset of JSON)
             try:
-                # Try to parse as YAML (which is a superset of JSON)
-                metadata = yaml.safe_load(metadata_str)
-                if metadata is None:
-                    # Empty or invalid content
-                    raise ParserError(
-                        f"Invalid inline metadata at line {line_num}: empty or invalid content"
-                    )
-                if not isinstance(metadata, dict):
-                    raise ParserError(
-                        f"Invalid inline metadata at line {line_num}: expected dictionary, got {type(metadata).__name__}"
-                    )
-                tasks.append(metadata)
-            except yaml.YAMLError as e:
+                metadata = json.loads(metadata_str)
+            except json.JSONDecodeError:
+                metadata = yaml.load(metadata_str, Loader=_SafeLoader)
+            if metadata is None:
+                # Empty or invalid content
+                raise ParserError(
+                    f"Invalid inline metadata at line {_line_number(playbook_content, match)}: "
+                    "empty or invalid content"
+                )
+            if not isinstance(metadata, dict):
                 raise ParserError(
-                    f"Failed to parse inline metadata at line {line_num}: {e}"
+                    f"Invalid inline metadata at line {_line_number(playbook_content, match)}: "
+                    f"expected dictionary, got {type(metadata).__name__}"
                 )
+            tasks.append(metadata)
+        except yaml.YAMLError as e:
+            raise ParserError(
+                f"Failed to parse inline metadata at line "
+                f"{_line_number(playbook_content, match)}: {e}"
+            )
 
     return tasks
 
 
+def _iter_playbook_files(directory: Path) -> Iterator[Path]:
+    """Walk a directory tree and yield its playbook files.
+
+    Yields the same files, in the same order, as filtering directory.rglob("*")
+    by extension: a directory's own files first, then each subdirectory's tree
+    in turn, without following symlinked directories. Entries are classified
+    from the directory listing itself, so most need no stat call, and only
+    playbook names are turned into Path objects.
+
+    Args:
+        directory: Directory to walk.
+
+    Yields:
+        Paths of the playbook files found.
+    """
+    subdirectories = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1] in _PLAYBOOK_EXTENSIONS and entry.is_file():
+                yield directory / entry.name
+            if entry.is_dir() and not entry.is_symlink():
+                subdirectories.append(entry.name)
+
+    for name in subdirectories:
+        yield from _iter_playbook_files(directory / name)
+
+
+def _parse_playbook_file(file_path: Path) -> List[Dict]:
+    """Read a playbook file and extract its inline task metadata.
+
+    Args:
+        file_path: Path to the playbook file.
+
+    Returns:
+        List of task metadata dictionaries found in the playbook.
+
+    Raises:
+        ParserError: If the file cannot be read or its metadata is invalid.
+    """
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_PLAYBOOK_THRESHOLD:
+                # Scan large playbooks in the page cache; only those with
+                # metadata are copied onto the heap
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if mapped.find(_SAID_MARKER_BYTES) == -1:
+                        return []
+                    data = mapped[:]
+            else:
+                data = f.read()
+    except IOError as e:
+        raise ParserError(f"Failed to read playbook file {file_path}: {e}")
+
+    # Most playbooks carry no metadata; those are never decoded
+    if _SAID_MARKER_BYTES not in data:
+        return []
+
+    content = data.decode("utf-8")
+    if "\r" in content:
+        # Translate newlines like text-mode reading does
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    try:
+        return parse_inline_metadata(content)
+    except ParserError as e:
+        # Re-raise with file context
+        raise ParserError(f"Error in {file_path}: {e}")
+
+
+def _parse_playbook_chunk(file_paths: List[Path]) -> List[List[Dict]]:
+    """Extract the inline task metadata of a chunk of playbook files.
+
+    Args:
+        file_paths: Paths of the playbook files.
+
+    Returns:
+        One list of task metadata dictionaries per playbook, in order.
+    """
+    return [_parse_playbook_file(file_path) for file_path in file_paths]
+
+
+def _copy_task(task: Dict) -> Dict:
+    """Copy a cached task metadata dictionary for a caller.
+
+    The list values (provides, depends_on, ...) become TaskMetadata fields
+    as they are, and callers extend those lists, so they are copied too.
+
+    Args:
+        task: Task metadata dictionary from the cache.
+
+    Returns:
+        A copy that shares no mutable value with the cache.
+    """
+    return {key: list(value) if isinstance(value, list) else value for key, value in task.items()}
+
+
+def _parse_playbook_files(file_paths: List[Path]) -> List[List[Dict]]:
+    """Extract the inline task metadata of many playbook files.
+
+    Playbooks unchanged since they were last parsed are served from a cache;
+    the rest are parsed, large batches across a pool of worker processes.
+    Results, and the error raised for the first invalid playbook, are the
+    same as when parsing serially in the given order.
+
+    Args:
+        file_paths: Paths of the playbook files.
+
+    Returns:
+        One list of task metadata dictionaries per playbook, in order.
+
+    Raises:
+        ParserError: If a file cannot be read or its metadata is invalid.
+    """
+    results: List[Optional[List[Dict]]] = [None] * len(file_paths)
+    keys: List[Optional[Tuple[str, int, int]]] = []
+    misses = []
+
+    # Unchanged playbooks are served from the cache without reading them
+    for index, file_path in enumerate(file_paths):
+        try:
+            stat = os.stat(file_path)
+            key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # Left for the parse to report
+            key = None
+        keys.append(key)
+
+        cached = _playbook_metadata_cache.get(key) if key is not None else None
+        if cached is not None:
+            _playbook_metadata_cache.move_to_end(key)
+            results[index] = [_copy_task(task) for task in cached]
+        else:
+            misses.append(index)
+
+    if misses:
+        parsed = _parse_uncached_playbooks([file_paths[index] for index in misses])
+        for index, inline_tasks in zip(misses, parsed):
+            results[index] = [_copy_task(task) for task in inline_tasks]
+            if keys[index] is not None:
+                _playbook_metadata_cache[keys[index]] = inline_tasks
+                if len(_playbook_metadata_cache) > _PLAYBOOK_CACHE_SIZE:
+                    _playbook_metadata_cache.popitem(last=False)
+
+    return results
+
+
+def _parse_uncached_playbooks(file_paths: List[Path]) -> List[List[Dict]]:
+    """Read and parse playbook files, in a process pool for large batches.
+
+    Args:
+        file_paths: Paths of the playbook files.
+
+    Returns:
+        One list of task metadata dictionaries per playbook, in order.
+
+    Raises:
+        ParserError: If a file cannot be read or its metadata is invalid.
+    """
+    workers = min(os.cpu_count() or 1, len(file_paths) // MIN_PLAYBOOKS_PER_WORKER)
+
+    if len(file_paths) >= PARALLEL_PARSE_THRESHOLD and workers > 1:
+        chunk_size = -(-len(file_paths) // workers)
+        chunks = [
+            file_paths[start : start + chunk_size]
+            for start in range(0, len(file_paths), chunk_size)
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                return [
+                    inline_tasks
+                    for chunk in executor.map(_parse_playbook_chunk, chunks)
+                    for inline_tasks in chunk
+                ]
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (e.g. restricted sandboxes);
+            # parsing serially gives the same result
+            pass
+
+    return _parse_playbook_chunk(file_paths)
+
+
 def parse_playbook_directory(directory: Union[str, Path]) -> DependencyMap:
     """Parse all playbooks in a directory and extract inline metadata.
 
@@ -221,22 +486,8 @@ def parse_playbook_directory(directory: Union[str, Path]) -> DependencyMap:
         raise ParserError(f"Path is not a directory: {directory}")
 
     all_tasks = []
-
-    # Common Ansible playbook file extensions
-    playbook_extensions = {".yml", ".yaml"}
-
-    for file_path in directory.rglob("*"):
-        if file_path.is_file() and file_path.suffix in playbook_extensions:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    inline_tasks = parse_inline_metadata(content)
-                    all_tasks.extend(inline_tasks)
-            except IOError as e:
-                raise ParserError(f"Failed to read playbook file {file_path}: {e}")
-            except ParserError as e:
-                # Re-raise with file context
-                raise ParserError(f"Error in {file_path}: {e}")
+    for inline_tasks in _parse_playbook_files(list(_iter_playbook_files(directory))):
+        all_tasks.extend(inline_tasks)
 
     if not all_tasks:
         raise ParserError(
@@ -291,15 +542,21 @@ def discover_dependency_map(
         start_path.parent.parent.parent,
     ]
 
+    # Near the filesystem root (or for a relative start path like ".") the
+    # parents collapse onto the same directory; search each one only once
+    unique_paths: Dict[str, Path] = {}
+    for search_path in search_paths:
+        unique_paths.setdefault(_resolve(os.path.abspath(search_path)), search_path)
+
     found_maps = []
     
-    for search_path in search_paths:
+    for search_path in unique_paths.values():
         if not search_path.exists():
             continue
 
         for filename in filenames:
             candidate = search_path / filename
-            if candidate.exists() and candidate.is_file():
+            if candidate.is_file():
                 try:
                     dep_map = parse_dependency_map(candidate)
                     found_maps.append((candidate, dep_map))
@@ -341,18 +598,17 @@ def _merge_dependency_maps(maps: List[DependencyMap]) -> DependencyMap:
     if len(maps) == 1:
         return maps[0]
     
-    # Collect all tasks, deduplicating by name
-    seen_names = set()
-    merged_tasks = []
-    
+    # Collect all tasks, deduplicating by name; dicts keep insertion order, so
+    # tasks stay in first-occurrence order
+    merged: Dict[str, TaskMetadata] = {}
     for dep_map in maps:
         for task in dep_map.tasks:
-            if task.name not in seen_names:
-                merged_tasks.append(task)
-                seen_names.add(task.name)
-    
-    # Create merged map
+            merged.setdefault(task.name, task)
+    merged_tasks = list(merged.values())
+
+    # Create merged map from the already validated tasks; only the map-level
+    # checks (unique names, references between tasks) need to run again
     try:
-        return validate_dependency_map({"tasks": [task.__dict__ for task in merged_tasks]})
+        return DependencyMap(tasks=merged_tasks)
     except SchemaError as e:
         raise ParserError(f"Failed to merge dependency maps: {e}")
@@ -4,7 +4,7 @@ This module provides functionality to resolve all dependencies and triggers
 for a set of matched tasks, using topological sort to determine execution order.
 """
 
-from typing import List, Set
+from typing import FrozenSet, List, Set
 
 from said.dag_builder import CycleDetectedError, DAGError, DependencyGraph
 from said.schema import DependencyMap
@@ -31,6 +31,8 @@ class DependencyResolver:
         try:
             self.dependency_map = dependency_map
             self.graph = DependencyGraph(dependency_map)
+            # The graph never changes, so its task names are captured once
+            self._all_task_names: FrozenSet[str] = frozenset(self.graph.get_all_tasks())
         except CycleDetectedError as e:
             raise ResolverError(f"Invalid dependency map: {e}")
         except DAGError as e:
@@ -61,36 +63,22 @@ class DependencyResolver:
             return []
 
         # Validate that all matched tasks exist
-        all_task_names = self.graph.get_all_tasks()
-        invalid_tasks = matched_tasks - all_task_names
+        invalid_tasks = matched_tasks - self._all_task_names
         if invalid_tasks:
             raise ResolverError(
                 f"Matched tasks not found in dependency map: {invalid_tasks}"
             )
 
-        # Start with the matched tasks
-        tasks_to_execute = set(matched_tasks)
-
-        # Add all dependencies (transitive)
-        for task_name in matched_tasks:
-            try:
-                dependencies = self.graph.get_all_dependencies(task_name)
-                tasks_to_execute.update(dependencies)
-            except DAGError as e:
-                raise ResolverError(f"Failed to get dependencies for {task_name}: {e}")
-
-        # Optionally add all triggered tasks (transitive)
-        if include_triggers:
-            for task_name in matched_tasks:
-                try:
-                    # Get all tasks that are triggered by this task
-                    # (these are the successors in the graph for trigger edges)
-                    triggered = self.graph.get_all_dependents(task_name)
-                    tasks_to_execute.update(triggered)
-                except DAGError as e:
-                    raise ResolverError(
-                        f"Failed to get triggered tasks for {task_name}: {e}"
-                    )
+        # Collect the matched tasks with all their dependencies and, optionally,
+        # all tasks they trigger (both transitive) in a single pass
+        try:
+            tasks_to_execute = self.graph.collect(
+                matched_tasks,
+                include_dependencies=True,
+                include_dependents=include_triggers,
+            )
+        except DAGError as e:
+            raise ResolverError(f"Failed to collect dependencies and triggered tasks: {e}")
 
         # Get execution order using topological sort
         try:
@@ -5,7 +5,8 @@ validation logic to ensure configuration correctness.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from functools import cached_property
+from typing import FrozenSet, List, Optional, Set
 
 
 class SchemaError(Exception):
@@ -113,7 +114,7 @@ class DependencyMap:
             )
 
         # Validate that all 'triggers' reference existing task names
-        all_task_names = set(task_names)
+        all_task_names = self.task_names
         for task in self.tasks:
             invalid_triggers = set(task.triggers) - all_task_names
             if invalid_triggers:
@@ -187,6 +188,18 @@ class DependencyMap:
             all_provides.update(task.provides)
         return all_provides
 
+    @cached_property
+    def task_names(self) -> FrozenSet[str]:
+        """Frozen set of all task names, computed once on first access.
+
+        Computed lazily rather than during validation so that maps built
+        without validation (e.g. via object.__new__) still provide it.
+
+        Returns:
+            Frozen set of all task names.
+        """
+        return frozenset(task.name for task in self.tasks)
+
     def get_all_task_names(self) -> Set[str]:
         """Get all task names.
 
@@ -5,9 +5,11 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from git import Repo
 
 from said.coordinator import CoordinatorError, WorkflowCoordinator
 from said.git_detector import GitDetectorError
+from said.matcher import match_files_to_tasks
 from said.parser import ParserError
 from said.resolver import ResolverError
 from said.schema import DependencyMap, TaskMetadata
@@ -233,6 +235,27 @@ class TestWorkflowCoordinator:
         result = coordinator.check_safety_conditions(["dependency_map.yml"])
         assert result is True
 
+    def test_check_safety_conditions_nested_dependency_map(self, mock_git_detector):
+        """Test safety check for dependency maps outside the repository root."""
+        coordinator = WorkflowCoordinator(logger=logging.getLogger("test"))
+        coordinator.git_detector = mock_git_detector
+
+        assert coordinator.check_safety_conditions(["roles/web/dependency_map.yaml"])
+        assert coordinator.check_safety_conditions(["playbooks/dependency_map.yml"])
+
+    def test_check_safety_conditions_said_code_reported_first(self, mock_git_detector):
+        """Test that a SAID code change is reported ahead of a dependency map change."""
+        logger = logging.getLogger("test")
+        coordinator = WorkflowCoordinator(logger=logger)
+        coordinator.git_detector = mock_git_detector
+
+        with patch.object(logger, "warning") as mock_warning:
+            result = coordinator.check_safety_conditions(
+                ["dependency_map.yml", "src/said/cli.py"]
+            )
+        assert result is True
+        assert "SAID code changed (src/said/cli.py)" in mock_warning.call_args[0][0]
+
     def test_check_safety_conditions_normal(self, mock_git_detector):
         """Test safety check for normal changes."""
         coordinator = WorkflowCoordinator(logger=logging.getLogger("test"))
@@ -241,6 +264,62 @@ class TestWorkflowCoordinator:
         result = coordinator.check_safety_conditions(["normal_file.yml"])
         assert result is False
 
+    def test_get_changed_files_uses_watch_file_pathspecs(
+        self, mock_git_detector, sample_dependency_map
+    ):
+        """Test that a loaded dependency map narrows the git diff with pathspecs."""
+        with patch("said.coordinator.parse_dependency_map") as mock_parse:
+            mock_parse.return_value = sample_dependency_map
+            coordinator = WorkflowCoordinator(
+                dependency_map_path="/path/to/map.yml",
+                logger=logging.getLogger("test"),
+            )
+            coordinator.git_detector = mock_git_detector
+            coordinator.load_dependency_map()
+
+            coordinator.get_changed_files(from_commit="abc123")
+            pathspecs = mock_git_detector.get_changed_files.call_args[1]["pathspecs"]
+            assert ":(top)src/said/" in pathspecs
+            assert ":(top)*dependency_map.yml*" in pathspecs
+            for pattern in sample_dependency_map.tasks[0].watch_files:
+                assert f":(top){pattern}" in pathspecs
+                assert f":(top)*/{pattern}" in pathspecs
+
+    def test_validate_variables_max_errors(self, mock_git_detector, sample_dependency_map):
+        """Test that collected validation errors can be capped."""
+        coordinator = WorkflowCoordinator(logger=logging.getLogger("test"))
+        coordinator.git_detector = mock_git_detector
+        coordinator.dependency_map = sample_dependency_map
+
+        report = coordinator.validate_variables(
+            {"missing1", "missing2"}, collect_all_errors=True
+        )
+        assert report["total_errors"] == 2
+
+        report = coordinator.validate_variables(
+            {"missing1", "missing2"}, collect_all_errors=True, max_errors=1
+        )
+        assert report["total_errors"] == 1
+        assert report["errors"][0]["error_type"] == "invalid_task_reference"
+
+    def test_last_successful_commit_is_memoized(self, mock_git_detector, mock_state_store):
+        """Test that the state store is read once until refreshed or updated."""
+        coordinator = WorkflowCoordinator(logger=logging.getLogger("test"))
+        coordinator.git_detector = mock_git_detector
+        coordinator.state_store = mock_state_store
+
+        coordinator.get_changed_files()
+        coordinator.get_changed_files()
+        mock_state_store.get_last_successful_commit.assert_called_once_with("default")
+
+        coordinator.update_successful_commit("def456")
+        assert coordinator.get_last_successful_commit() == "def456"
+        assert mock_state_store.get_last_successful_commit.call_count == 1
+
+        coordinator.refresh()
+        assert coordinator.get_last_successful_commit() == "prev123"
+        assert mock_state_store.get_last_successful_commit.call_count == 2
+
     def test_update_successful_commit(self, mock_git_detector, mock_state_store):
         """Test updating successful commit."""
         coordinator = WorkflowCoordinator(logger=logging.getLogger("test"))
@@ -300,3 +379,157 @@ class TestWorkflowCoordinator:
             assert len(result["execution_order"]) > 0
             assert "task1" in result["execution_order"]
             assert "task2" in result["execution_order"]
+
+            # The matched tasks are the caller's own mutable set
+            assert result["matched_tasks"] == {"task1", "task2"}
+            result["matched_tasks"].add("extra")
+            assert sample_dependency_map.task_names == frozenset({"task1", "task2"})
+
+    def test_run_full_workflow_passes_max_errors(
+        self, mock_git_detector, mock_state_store, sample_dependency_map
+    ):
+        """Test that the workflow caps collected validation errors."""
+        with patch("said.coordinator.parse_dependency_map") as mock_parse:
+            mock_parse.return_value = sample_dependency_map
+            coordinator = WorkflowCoordinator(
+                dependency_map_path="/path/to/map.yml",
+                logger=logging.getLogger("test"),
+            )
+            coordinator.git_detector = mock_git_detector
+            coordinator.state_store = mock_state_store
+
+            with patch.object(
+                coordinator, "validate_variables", return_value=None
+            ) as mock_validate:
+                coordinator.run_full_workflow(
+                    full_deploy=True, collect_all_errors=True, max_errors=3
+                )
+            mock_validate.assert_called_once_with(
+                {"task1", "task2"}, collect_all_errors=True, max_errors=3
+            )
+
+    def test_run_full_workflow_without_command_string(
+        self, mock_git_detector, mock_state_store, sample_dependency_map
+    ):
+        """Test that the shell string can be skipped when only argv is needed."""
+        with patch("said.coordinator.parse_dependency_map") as mock_parse:
+            mock_parse.return_value = sample_dependency_map
+            coordinator = WorkflowCoordinator(
+                dependency_map_path="/path/to/map.yml",
+                logger=logging.getLogger("test"),
+            )
+            coordinator.git_detector = mock_git_detector
+            coordinator.state_store = mock_state_store
+
+            result = coordinator.run_full_workflow(
+                full_deploy=True, validate_vars=False, include_command_string=False
+            )
+            assert result["command"][0] == "ansible-playbook"
+            assert result["command_string"] is None
+
+    def test_run_full_workflow_skip_validation(
+        self, mock_git_detector, mock_state_store, sample_dependency_map
+    ):
+        """Test that disabling validation skips variable checks but keeps inventory."""
+        with patch("said.coordinator.parse_dependency_map") as mock_parse, patch(
+            "said.coordinator.check_variables_required"
+        ) as mock_check:
+            mock_parse.return_value = sample_dependency_map
+            coordinator = WorkflowCoordinator(
+                dependency_map_path="/path/to/map.yml",
+                inventory="inventory.ini",
+                logger=logging.getLogger("test"),
+            )
+            coordinator.git_detector = mock_git_detector
+            coordinator.state_store = mock_state_store
+
+            result = coordinator.run_full_workflow(full_deploy=True, validate_vars=False)
+            mock_check.assert_not_called()
+            assert "-i" in result["command"]
+            assert "inventory.ini" in result["command"]
+
+
+class TestPathspecFiltering:
+    """Test the git pathspec filter against a real repository."""
+
+    @staticmethod
+    def _commit_files(tmp_path, paths):
+        """Commit a placeholder, then the given files; return the first commit."""
+        repo = Repo.init(tmp_path)
+        (tmp_path / "README").write_text("readme")
+        repo.index.add(["README"])
+        base = repo.index.commit("Initial commit").hexsha
+        for path in paths:
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_text(path)
+        repo.index.add(paths)
+        repo.index.commit("Add files")
+        repo.close()
+        return base
+
+    @staticmethod
+    def _coordinator(tmp_path, watch_files):
+        """Build a coordinator on tmp_path whose one task watches watch_files."""
+        dependency_map = DependencyMap(
+            tasks=[TaskMetadata(name="task1", provides=["r1"], watch_files=watch_files)]
+        )
+        with patch("said.coordinator.parse_dependency_map", return_value=dependency_map):
+            coordinator = WorkflowCoordinator(
+                repo_path=str(tmp_path),
+                dependency_map_path=str(tmp_path / "map.yml"),
+                state_store=MagicMock(),
+                logger=logging.getLogger("test"),
+            )
+            coordinator.load_dependency_map()
+        return coordinator
+
+    def test_recursive_pattern_matches_zero_directories(self, tmp_path):
+        """Test that "**/" pathspecs keep files the matcher matches with no directory."""
+        base = self._commit_files(tmp_path, ["roles/main.yml"])
+        coordinator = self._coordinator(tmp_path, ["roles/**/*.yml"])
+
+        changed_files = coordinator.get_changed_files(from_commit=base)
+
+        assert changed_files == ["roles/main.yml"]
+        assert coordinator.match_files_to_tasks(changed_files) == {"task1"}
+        coordinator.git_detector.repo.close()
+
+    def test_filter_keeps_every_matched_file(self, tmp_path):
+        """Test that filtering the diff never drops a file the matcher matches."""
+        watch_files = [
+            "*.j2",
+            "nginx.conf",
+            "files/*",
+            "roles/**/tasks/*.yml",
+        ]
+        paths = [
+            "site.j2",
+            "roles/web/templates/site.j2",
+            "nginx.conf",
+            "etc/nginx/nginx.conf",
+            "nginx.conf.bak",
+            "files/app.cfg",
+            "files/deep/app.cfg",
+            "other/files/app.cfg",
+            "roles/tasks/main.yml",
+            "roles/web/tasks/main.yml",
+            "roles/web/db/tasks/main.yml",
+            "roles/web/handlers/main.yml",
+            "docs/readme.md",
+        ]
+        base = self._commit_files(tmp_path, paths)
+        coordinator = self._coordinator(tmp_path, watch_files)
+
+        unfiltered = coordinator.git_detector.get_changed_files(base, "HEAD")
+        filtered = coordinator.get_changed_files(from_commit=base)
+
+        assert sorted(unfiltered) == sorted(paths)
+        expected = {
+            path
+            for path in unfiltered
+            if match_files_to_tasks([path], coordinator.dependency_map)
+        }
+        assert expected <= set(filtered)
+        assert "roles/tasks/main.yml" in expected
+        assert "docs/readme.md" not in filtered
+        coordinator.git_detector.repo.close()
@@ -2,7 +2,13 @@
 
 import pytest
 
-from said.dag_builder import CycleDetectedError, DAGError, DependencyGraph
+from said.dag_builder import (
+    CycleDetectedError,
+    DAGError,
+    DependencyGraph,
+    find_cycle_paths,
+    find_scc_cycles,
+)
 from said.schema import DependencyMap, TaskMetadata
 
 
@@ -117,6 +123,20 @@ class TestDependencyGraph:
         assert order.index("task1") < order.index("task2")
         assert order.index("task2") < order.index("task3")
 
+    def test_topological_sort_prefers_more_dependents(self):
+        """Test that ready tasks with more dependents are ordered first."""
+        leaf = TaskMetadata(name="leaf", provides=["leaf_res"])
+        hub = TaskMetadata(name="hub", provides=["hub_res"])
+        user1 = TaskMetadata(name="user1", provides=["u1"], depends_on=["hub_res"])
+        user2 = TaskMetadata(name="user2", provides=["u2"], depends_on=["hub_res"])
+
+        dep_map = DependencyMap(tasks=[leaf, hub, user1, user2])
+        graph = DependencyGraph(dep_map)
+
+        # hub unblocks two tasks, so it is placed before the independent leaf;
+        # ties keep declaration order
+        assert graph.topological_sort() == ["hub", "leaf", "user1", "user2"]
+
     def test_get_execution_order(self):
         """Test getting execution order for specific tasks."""
         task1 = TaskMetadata(name="task1", provides=["resource1"])
@@ -138,6 +158,86 @@ class TestDependencyGraph:
         assert order.index("task1") < order.index("task2")
         assert order.index("task2") < order.index("task3")
 
+    def test_cached_results_are_copies(self):
+        """Test that mutating returned sets does not affect cached results."""
+        task1 = TaskMetadata(name="task1", provides=["resource1"])
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2"], depends_on=["resource1"]
+        )
+
+        dep_map = DependencyMap(tasks=[task1, task2])
+        graph = DependencyGraph(dep_map)
+
+        graph.get_all_dependencies("task2").add("bogus")
+        graph.get_all_dependents("task1").clear()
+        graph.topological_sort().reverse()
+
+        assert graph.get_all_dependencies("task2") == {"task1"}
+        assert graph.get_all_dependents("task1") == {"task2"}
+        assert graph.topological_sort() == ["task1", "task2"]
+        assert graph.get_execution_order({"task2"}) == ["task1", "task2"]
+
+    def test_get_execution_order_shared_dependencies(self):
+        """Test execution order for several tasks sharing dependencies."""
+        task1 = TaskMetadata(name="task1", provides=["resource1"])
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2"], depends_on=["resource1"]
+        )
+        task3 = TaskMetadata(
+            name="task3", provides=["resource3"], depends_on=["resource1"]
+        )
+        task4 = TaskMetadata(name="task4", provides=["resource4"])
+
+        dep_map = DependencyMap(tasks=[task1, task2, task3, task4])
+        graph = DependencyGraph(dep_map)
+
+        order = graph.get_execution_order({"task2", "task3"})
+        assert sorted(order) == ["task1", "task2", "task3"]
+        assert order[0] == "task1"
+
+    def test_collect_matches_per_task_closures(self):
+        """Test that collect equals the union of the per-task closures."""
+        task1 = TaskMetadata(name="task1", provides=["resource1"])
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2"], depends_on=["resource1"]
+        )
+        task3 = TaskMetadata(
+            name="task3", provides=["resource3"], depends_on=["resource2"]
+        )
+        task4 = TaskMetadata(name="task4", provides=["resource4"], triggers=["task3"])
+        task5 = TaskMetadata(name="task5", provides=["resource5"])
+
+        dep_map = DependencyMap(tasks=[task1, task2, task3, task4, task5])
+        graph = DependencyGraph(dep_map)
+
+        assert graph.collect({"task2"}) == {"task1", "task2"}
+        assert graph.collect({"task2", "task4"}, include_dependents=True) == {
+            "task1",
+            "task2",
+            "task3",
+            "task4",
+        }
+        assert graph.collect({"task3"}, include_dependencies=False) == {"task3"}
+
+        with pytest.raises(DAGError):
+            graph.collect({"missing"})
+
+    def test_resource_to_tasks_index(self):
+        """Test that the resource index built for the graph is exposed."""
+        task1 = TaskMetadata(name="task1", provides=["resource1", "shared"])
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2", "shared"], depends_on=["resource1"]
+        )
+
+        dep_map = DependencyMap(tasks=[task1, task2])
+        graph = DependencyGraph(dep_map)
+
+        assert graph.resource_to_tasks == {
+            "resource1": {"task1"},
+            "resource2": {"task2"},
+            "shared": {"task1", "task2"},
+        }
+
     def test_cycle_detection(self):
         """Test that cycles are detected."""
         task1 = TaskMetadata(
@@ -153,6 +253,70 @@ class TestDependencyGraph:
             DependencyGraph(dep_map)
         assert "circular dependency" in str(exc_info.value).lower()
 
+    def test_cycle_message_lists_path(self):
+        """Test that the cycle error names the tasks on the cycle."""
+        task1 = TaskMetadata(name="task1", provides=["resource1"])
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2"], depends_on=["resource1", "resource3"]
+        )
+        task3 = TaskMetadata(
+            name="task3", provides=["resource3"], depends_on=["resource2"]
+        )
+
+        dep_map = DependencyMap(tasks=[task1, task2, task3])
+
+        with pytest.raises(CycleDetectedError) as exc_info:
+            DependencyGraph(dep_map)
+        message = str(exc_info.value)
+        assert "task2 -> task3 -> task2" in message or "task3 -> task2 -> task3" in message
+        assert "task1" not in message
+
+    def test_self_trigger_is_cycle(self):
+        """Test that a task triggering itself is reported as a cycle."""
+        task1 = TaskMetadata(
+            name="task1", provides=["resource1"], triggers=["task1"]
+        )
+
+        dep_map = DependencyMap(tasks=[task1])
+
+        with pytest.raises(CycleDetectedError) as exc_info:
+            DependencyGraph(dep_map)
+        assert "task1 -> task1" in str(exc_info.value)
+
+    def test_deep_chain_does_not_recurse(self):
+        """Test that cycle detection handles chains deeper than the recursion limit."""
+        tasks = [TaskMetadata(name="task0", provides=["resource0"])]
+        for i in range(1, 3000):
+            tasks.append(
+                TaskMetadata(
+                    name=f"task{i}",
+                    provides=[f"resource{i}"],
+                    depends_on=[f"resource{i - 1}"],
+                )
+            )
+
+        graph = DependencyGraph(DependencyMap(tasks=tasks))
+        assert graph.topological_sort()[-1] == "task2999"
+
+    def test_duplicate_edges_collapse(self):
+        """Test that repeated resources produce a single dependency edge."""
+        task1 = TaskMetadata(name="task1", provides=["resource1", "resource2"])
+        task2 = TaskMetadata(
+            name="task2",
+            provides=["resource3"],
+            depends_on=["resource1", "resource2"],
+            triggers=[],
+        )
+        task3 = TaskMetadata(
+            name="task3", provides=["resource4"], triggers=["task2"]
+        )
+
+        dep_map = DependencyMap(tasks=[task1, task2, task3])
+        graph = DependencyGraph(dep_map)
+
+        assert graph.get_dependencies("task2") == {"task1", "task3"}
+        assert graph.topological_sort().count("task2") == 1
+
     def test_self_loop_prevention(self):
         """Test that self-loops are prevented."""
         task1 = TaskMetadata(
@@ -232,3 +396,79 @@ class TestDependencyGraph:
         # task4 transitively depends on task1
         all_deps = graph.get_all_dependencies("task4")
         assert "task1" in all_deps
+
+
+class TestFindSccCycles:
+    """Test cases for find_scc_cycles."""
+
+    def test_acyclic_map_has_no_cycles(self):
+        """Test that an acyclic map yields no cycles."""
+        task1 = TaskMetadata(name="task1", provides=["resource1"])
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2"], depends_on=["resource1"]
+        )
+
+        dep_map = DependencyMap(tasks=[task1, task2])
+
+        assert find_scc_cycles(dep_map) == []
+
+    def test_reports_every_cycle(self):
+        """Test that independent cycles are each reported."""
+        tasks = [
+            TaskMetadata(name="a", provides=["ra"], depends_on=["rb"]),
+            TaskMetadata(name="b", provides=["rb"], depends_on=["ra"]),
+            TaskMetadata(name="c", provides=["rc"]),
+            TaskMetadata(name="d", provides=["rd"], depends_on=["re"]),
+            TaskMetadata(name="e", provides=["re"], depends_on=["rd"]),
+            TaskMetadata(name="f", provides=["rf"], triggers=["f"]),
+        ]
+
+        dep_map = DependencyMap(tasks=tasks)
+
+        assert find_scc_cycles(dep_map) == [["a", "b"], ["d", "e"], ["f"]]
+
+    def test_ignores_missing_references(self):
+        """Test that unknown resources and triggers do not hide cycles."""
+        tasks = [
+            TaskMetadata(
+                name="a", provides=["ra"], depends_on=["rb", "missing"], triggers=["ghost"]
+            ),
+            TaskMetadata(name="b", provides=["rb"], depends_on=["ra"]),
+        ]
+
+        # Build the map without validation, as the builder does for broken maps
+        dep_map = object.__new__(DependencyMap)
+        dep_map.tasks = tasks
+
+        assert find_scc_cycles(dep_map) == [["a", "b"]]
+
+    def test_non_strict_graph_is_fully_initialized(self):
+        """Test that a non-strict graph keeps cycles and still answers queries."""
+        dep_map = DependencyMap(
+            tasks=[
+                TaskMetadata(name="a", provides=["ra"], depends_on=["rb"]),
+                TaskMetadata(name="b", provides=["rb"], depends_on=["ra"]),
+                TaskMetadata(name="c", provides=["rc"]),
+            ]
+        )
+
+        with pytest.raises(CycleDetectedError):
+            DependencyGraph(dep_map)
+
+        graph = DependencyGraph(dep_map, strict=False)
+        assert graph.get_all_tasks() == {"a", "b", "c"}
+        assert graph.get_dependencies("a") == {"b"}
+        assert graph.topological_sort() == ["c"]
+
+    def test_cycle_paths_follow_edges(self):
+        """Test that each cycle path walks real dependency edges."""
+        dep_map = DependencyMap(
+            tasks=[
+                TaskMetadata(name="a", provides=["ra"], depends_on=["rc"]),
+                TaskMetadata(name="b", provides=["rb"], depends_on=["ra"]),
+                TaskMetadata(name="c", provides=["rc"], depends_on=["rb"]),
+                TaskMetadata(name="d", provides=["rd"]),
+            ]
+        )
+
+        assert find_cycle_paths(dep_map) == [(["a", "b", "c"], ["a", "b", "c"])]
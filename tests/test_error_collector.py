@@ -0,0 +1,131 @@
+"""Unit tests for error_collector module."""
+
+import io
+import json
+
+import pytest
+
+from said.error_collector import (
+    DependencyError,
+    DependencyErrorCollector,
+    DependencyErrorReport,
+    validate_dependency_map_comprehensive,
+)
+from said.schema import DependencyMap, TaskMetadata
+
+
+class TestDependencyErrorCollector:
+    """Test cases for DependencyErrorCollector class."""
+
+    def test_collect_circular_dependencies(self):
+        """Test that each cycle keeps both its members and a cycle path."""
+        dep_map = DependencyMap(
+            tasks=[
+                TaskMetadata(name="a", provides=["ra"], depends_on=["rc"]),
+                TaskMetadata(name="b", provides=["rb"], depends_on=["ra"]),
+                TaskMetadata(name="c", provides=["rc"], depends_on=["rb"]),
+                TaskMetadata(name="d", provides=["rd"], depends_on=["re"]),
+                TaskMetadata(name="e", provides=["re"], depends_on=["rd"]),
+            ]
+        )
+
+        collector = DependencyErrorCollector()
+        collector.collect_circular_dependencies(dep_map)
+
+        assert [error.error_type for error in collector.errors] == ["circular_dependency"] * 2
+        assert [error.details for error in collector.errors] == [
+            {"cycle": ["a", "b", "c"], "cycles": ["a -> b -> c -> a"]},
+            {"cycle": ["d", "e"], "cycles": ["d -> e -> d"]},
+        ]
+
+    def test_collect_circular_dependencies_acyclic(self):
+        """Test that an acyclic map produces no errors."""
+        dep_map = DependencyMap(
+            tasks=[
+                TaskMetadata(name="a", provides=["ra"]),
+                TaskMetadata(name="b", provides=["rb"], depends_on=["ra"]),
+            ]
+        )
+
+        collector = DependencyErrorCollector()
+        collector.collect_circular_dependencies(dep_map)
+
+        assert not collector.has_errors()
+
+    def test_report_summary_counts_every_error(self):
+        """Test that the summary covers errors added by any route."""
+        collector = DependencyErrorCollector()
+        collector.add(DependencyError("missing_trigger", "a", "first"))
+        collector.errors.append(DependencyError("missing_trigger", "b", "second"))
+        collector.errors.append(DependencyError("file_exists", "build", "third"))
+
+        report = collector.generate_report()
+
+        assert report.total_errors == 3
+        assert report.error_summary == {"missing_trigger": 2, "file_exists": 1}
+
+
+class TestValidateDependencyMapComprehensive:
+    """Test cases for validate_dependency_map_comprehensive function."""
+
+    def test_max_errors_caps_report(self):
+        """Test that the report and its summary stop at max_errors."""
+        dep_map = DependencyMap(
+            tasks=[
+                TaskMetadata(name="a", provides=["ra"], depends_on=["rb"]),
+                TaskMetadata(name="b", provides=["rb"], depends_on=["ra"]),
+            ]
+        )
+
+        report = validate_dependency_map_comprehensive(
+            dep_map, task_names={"a", "x", "y"}, max_errors=2
+        )
+
+        assert report.total_errors == 2
+        assert report.error_summary == {"circular_dependency": 1, "invalid_task_reference": 1}
+
+
+class TestDependencyErrorReport:
+    """Test cases for DependencyErrorReport class."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "plain message",
+            "café ☃",
+            {1: "int key", True: "bool key", None: "null key"},
+            {"wide": 2**70},
+        ],
+    )
+    def test_to_json_matches_stdlib(self, message):
+        """Test that to_json produces the stdlib document for awkward values."""
+        report = DependencyErrorReport(
+            errors=[DependencyError("builder_error", "build", message)],
+            total_errors=1,
+            error_summary={"builder_error": 1},
+        )
+
+        assert report.to_json() == json.dumps(report.to_dict(), indent=2)
+
+    @pytest.mark.parametrize("indent", [0, 1, 2, 4])
+    @pytest.mark.parametrize("error_count", [0, 1, 3])
+    def test_write_json_matches_stdlib(self, indent, error_count):
+        """Test that write_json streams the same document json.dumps builds."""
+        errors = [
+            DependencyError(
+                "missing_dependency",
+                f"task{index}",
+                {"invalid_dependency": {"dep": ["a", "é"]}} if index % 2 else "message",
+                {"available_resources": [], "nested": {"count": index}},
+            )
+            for index in range(error_count)
+        ]
+        collector = DependencyErrorCollector()
+        for error in errors:
+            collector.add(error)
+        report = collector.generate_report()
+        stream = io.StringIO()
+
+        report.write_json(stream, indent=indent)
+
+        assert stream.getvalue() == json.dumps(report.to_dict(), indent=indent)
@@ -0,0 +1,119 @@
+"""Unit tests for error_parser module."""
+
+import said.variable_dependency_analyzer as analyzer
+from said.error_parser import (
+    parse_dependency_error,
+    parse_dependency_errors_bulk,
+    structure_dependency_error,
+)
+from said.schema import DependencyMap, TaskMetadata
+from said.variable_dependency_analyzer import VariableProducer
+
+
+def _dependency_map():
+    return DependencyMap(
+        tasks=[
+            TaskMetadata(name="setup_db", provides=["db_ready"]),
+            TaskMetadata(name="deploy_app", provides=["app_deployed"], depends_on=["db_ready"]),
+        ]
+    )
+
+
+class TestParseDependencyErrorsBulk:
+    """Test cases for parse_dependency_errors_bulk function."""
+
+    MESSAGES = [
+        # Matching, with and without the structure prefix
+        "Task 'deploy app' depends on non-existent resources: {'db_ready', \"cache\"}. "
+        "Available resources: app_deployed, db_host",
+        "Invalid dependency map structure: Task 'setup' depends on non-existent "
+        "resources: {net}. Available resources: disk",
+        # Contains the prefilter marker but does not match the full pattern
+        "Task 'setup' depends on non-existent resources: {net} and nothing else",
+        "depends on non-existent resources: {",
+        # Unrelated messages rejected by the prefilter
+        "Circular dependency detected in dependency graph",
+        "",
+    ]
+
+    def test_agrees_with_single_message_parser(self):
+        """Test that bulk parsing gives the same result as parsing one by one."""
+        expected = [parse_dependency_error(message) for message in self.MESSAGES]
+
+        assert parse_dependency_errors_bulk(self.MESSAGES) == expected
+        assert expected[0] == {
+            "task_name": "deploy app",
+            "invalid_dependencies": ["db_ready", "cache"],
+            "available_resources": ["app_deployed", "db_host"],
+        }
+        assert expected[1]["task_name"] == "setup"
+        assert expected[2:] == [None] * 4
+
+    def test_empty_input(self):
+        """Test that no messages give no results."""
+        assert parse_dependency_errors_bulk([]) == []
+
+
+class TestStructureDependencyError:
+    """Test cases for structure_dependency_error function."""
+
+    def test_skips_producer_analysis_when_message_lists_dependencies(self, monkeypatch):
+        """Test that listed, task-provided dependencies need no producer analysis."""
+        calls = []
+        monkeypatch.setattr(
+            analyzer, "build_producers_dictionary", lambda *args, **kwargs: calls.append(1) or {}
+        )
+        message = (
+            "Task 'deploy_app' depends on non-existent resources: {'db_ready'}. "
+            "Available resources: db_ready, app_deployed"
+        )
+
+        result = structure_dependency_error(message, dependency_map=_dependency_map())
+
+        assert calls == []
+        entry = result["message"]["invalid_dependency"]["db_ready"]
+        assert entry["available_resources"] == {
+            "db_ready": "setup_db",
+            "app_deployed": "deploy_app",
+        }
+
+    def test_producer_analysis_limited_to_message_names(self, monkeypatch):
+        """Test that only names from the message are taken from the producers."""
+        producers = {
+            "db_host": [VariableProducer("inventory", "group_vars/all.yml")],
+            "unrelated_var": [VariableProducer("task", "setup_db")],
+        }
+        monkeypatch.setattr(
+            analyzer, "build_producers_dictionary", lambda *args, **kwargs: producers
+        )
+        message = (
+            "Task 'deploy_app' depends on non-existent resources: {'db_host'}. "
+            "Available resources: db_ready"
+        )
+
+        result = structure_dependency_error(message, dependency_map=_dependency_map())
+
+        entry = result["message"]["invalid_dependency"]["db_host"]
+        assert entry["available_resources"] == {"db_host": "inventory", "db_ready": "setup_db"}
+
+    def test_runs_producer_analysis_for_unlisted_dependencies(self, monkeypatch):
+        """Test that a provided dependency missing from the message is still analyzed."""
+        calls = []
+        monkeypatch.setattr(
+            analyzer, "build_producers_dictionary", lambda *args, **kwargs: calls.append(1) or {}
+        )
+        message = (
+            "Task 'deploy_app' depends on non-existent resources: {'db_ready'}. "
+            "Available resources: app_deployed"
+        )
+
+        structure_dependency_error(message, dependency_map=_dependency_map())
+
+        assert calls == [1]
+
+    def test_unparseable_message(self):
+        """Test that an unrecognized message becomes a builder error."""
+        result = structure_dependency_error("something else went wrong")
+
+        assert result["error_type"] == "builder_error"
+        assert result["message"] == "something else went wrong"
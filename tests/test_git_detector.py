@@ -102,6 +102,32 @@ class TestGitDetector:
             assert sha2 == commit1.hexsha
             detector.repo.close()
 
+    def test_get_commit_sha_follows_new_commits(self):
+        """Test that movable refs resolve to their current commit on every call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repo.init(tmpdir)
+            (Path(tmpdir) / "test.txt").write_text("test")
+            repo.index.add(["test.txt"])
+            commit1 = repo.index.commit("Initial commit")
+            repo.create_tag("base")
+
+            branch = repo.active_branch.name
+
+            detector = GitDetector(tmpdir)
+            assert detector.get_commit_sha(branch) == commit1.hexsha
+            assert detector.get_commit_sha("HEAD") == commit1.hexsha
+            assert detector.get_commit_sha(commit1.hexsha) == commit1.hexsha
+
+            (Path(tmpdir) / "test.txt").write_text("changed")
+            repo.index.add(["test.txt"])
+            commit2 = repo.index.commit("Second commit")
+            repo.close()
+
+            assert detector.get_commit_sha("HEAD") == commit2.hexsha
+            assert detector.get_commit_sha(branch) == commit2.hexsha
+            assert detector.get_commit_sha("base") == commit1.hexsha
+            detector.repo.close()
+
     def test_get_commit_sha_invalid_ref(self):
         """Test getting commit SHA with invalid reference."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -143,6 +169,35 @@ class TestGitDetector:
             assert "file2.txt" not in changed  # Not modified
             detector.repo.close()
 
+    def test_get_changed_files_with_pathspecs(self):
+        """Test that pathspecs filter changed files inside git."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repo.init(tmpdir)
+
+            (Path(tmpdir) / "readme.txt").write_text("content")
+            repo.index.add(["readme.txt"])
+            commit1 = repo.index.commit("Initial commit")
+
+            (Path(tmpdir) / "roles" / "web" / "templates").mkdir(parents=True)
+            (Path(tmpdir) / "roles" / "web" / "templates" / "site.j2").write_text("x")
+            (Path(tmpdir) / "src" / "said").mkdir(parents=True)
+            (Path(tmpdir) / "src" / "said" / "cli.py").write_text("x")
+            (Path(tmpdir) / "notes.md").write_text("x")
+            repo.index.add(
+                ["roles/web/templates/site.j2", "src/said/cli.py", "notes.md"]
+            )
+            commit2 = repo.index.commit("Second commit")
+            repo.close()
+
+            detector = GitDetector(tmpdir)
+            changed = detector.get_changed_files(
+                commit1.hexsha,
+                commit2.hexsha,
+                pathspecs=[":(top)*/templates/*.j2", ":(top)src/said/"],
+            )
+            assert sorted(changed) == ["roles/web/templates/site.j2", "src/said/cli.py"]
+            detector.repo.close()
+
     def test_get_changed_files_no_changes(self):
         """Test getting changed files when there are no changes."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -260,6 +315,25 @@ class TestGitDetector:
                 detector.get_changed_files("commit1", "commit2")
             assert "Error getting changed files" in str(exc_info.value)
 
+    def test_get_changed_files_unusual_names(self):
+        """Test that file names git would quote are returned verbatim."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repo.init(tmpdir)
+
+            (Path(tmpdir) / "file1.txt").write_text("content1")
+            repo.index.add(["file1.txt"])
+            commit1 = repo.index.commit("Initial commit")
+
+            (Path(tmpdir) / "ünïcode name.yml").write_text("new")
+            repo.index.add(["ünïcode name.yml"])
+            commit2 = repo.index.commit("Add file with unusual name")
+            repo.close()
+
+            detector = GitDetector(tmpdir)
+            changed = detector.get_changed_files(commit1.hexsha, commit2.hexsha)
+            assert changed == ["ünïcode name.yml"]
+            detector.repo.close()
+
     def test_get_changed_files_filters_correctly(self):
         """Test that get_changed_files only returns added, copied, modified, renamed, or type-changed files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,143 @@
+"""Unit tests for inventory_loader module."""
+
+import os
+import threading
+
+import pytest
+
+import said.inventory_loader as inventory_loader
+from said.inventory_loader import (
+    _list_yaml_files,
+    _load_yaml_files,
+    _vars_search_dirs,
+    load_yaml_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_yaml_cache():
+    """Start and end every test with an empty YAML cache."""
+    inventory_loader._YAML_CACHE.clear()
+    yield
+    inventory_loader._YAML_CACHE.clear()
+
+
+class TestYamlCache:
+    """Test cases for the parsed YAML file cache."""
+
+    def test_unchanged_file_is_not_parsed_again(self, tmp_path, monkeypatch):
+        """Test that loading an unchanged file again is served from the cache."""
+        vars_file = tmp_path / "vars.yml"
+        vars_file.write_text("key: value\n")
+        parses = []
+        original_parse = inventory_loader._parse_yaml_file
+        monkeypatch.setattr(
+            inventory_loader,
+            "_parse_yaml_file",
+            lambda path: parses.append(path) or original_parse(path),
+        )
+
+        first = load_yaml_file(vars_file)
+        first["added"] = True
+        second = load_yaml_file(vars_file)
+
+        assert second == {"key": "value"}
+        assert len(parses) == 1
+
+    def test_modified_file_is_parsed_again(self, tmp_path):
+        """Test that editing a file invalidates its cache entry."""
+        vars_file = tmp_path / "vars.yml"
+        vars_file.write_text("key: value\n")
+        assert load_yaml_file(vars_file) == {"key": "value"}
+
+        vars_file.write_text("key: new value\n")
+        assert load_yaml_file(vars_file) == {"key": "new value"}
+
+    def test_concurrent_loads(self, tmp_path, monkeypatch):
+        """Test that loading from several threads at once is safe."""
+        monkeypatch.setattr(inventory_loader, "_YAML_CACHE_SIZE", 4)
+        paths = []
+        for index in range(16):
+            vars_file = tmp_path / f"vars{index}.yml"
+            vars_file.write_text(f"key{index}: {index}\n")
+            paths.append(vars_file)
+        failures = []
+
+        def load_all():
+            try:
+                for _ in range(20):
+                    for index, path in enumerate(paths):
+                        assert load_yaml_file(path) == {f"key{index}": index}
+            except Exception as e:  # pragma: no cover - reported below
+                failures.append(e)
+
+        threads = [threading.Thread(target=load_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert failures == []
+        assert len(inventory_loader._YAML_CACHE) <= 4
+
+    def test_pool_results_fill_the_cache(self, tmp_path, monkeypatch):
+        """Test that files parsed by worker processes are cached in the parent."""
+        monkeypatch.setattr(inventory_loader, "PARALLEL_LOAD_THRESHOLD", 4)
+        monkeypatch.setattr(inventory_loader, "MIN_FILES_PER_WORKER", 2)
+        monkeypatch.setattr(inventory_loader.os, "cpu_count", lambda: 2)
+        paths = []
+        for index in range(6):
+            vars_file = tmp_path / f"vars{index}.yml"
+            vars_file.write_text(f"key{index}: {index}\nshared: {index}\n")
+            paths.append(str(vars_file))
+
+        variables = _load_yaml_files(paths)
+
+        assert variables["shared"] == 5
+        assert len(variables) == 7
+        cached_paths = {key[0] for key in inventory_loader._YAML_CACHE}
+        assert cached_paths == {os.path.abspath(path) for path in paths}
+
+
+class TestListYamlFiles:
+    """Test cases for _list_yaml_files."""
+
+    def test_yml_before_yaml(self, tmp_path):
+        """Test that .yml files are listed before .yaml files."""
+        for name in ["b.yaml", "a.yml", "c.yaml", "d.yml", "notes.txt"]:
+            (tmp_path / name).write_text("{}\n")
+        (tmp_path / "nested.yml").mkdir()
+
+        names = [os.path.basename(path) for path in _list_yaml_files(tmp_path)]
+
+        assert sorted(names[:3]) == ["a.yml", "d.yml", "nested.yml"]
+        assert sorted(names[3:]) == ["b.yaml", "c.yaml"]
+
+
+class TestVarsSearchDirs:
+    """Test cases for _vars_search_dirs."""
+
+    def test_same_directory_searched_once(self, tmp_path, monkeypatch):
+        """Test that paths resolving to one directory are searched only once."""
+        (tmp_path / "group_vars").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        search_dirs = _vars_search_dirs("group_vars", tmp_path / "inventory")
+
+        assert [path.resolve() for path in search_dirs] == [(tmp_path / "group_vars").resolve()]
+
+    def test_last_occurrence_kept(self, tmp_path, monkeypatch):
+        """Test that a duplicate keeps the position of its last occurrence."""
+        inventory_dir = tmp_path / "inventories" / "prod"
+        (inventory_dir / "group_vars").mkdir(parents=True)
+        (tmp_path / "group_vars").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        search_dirs = _vars_search_dirs("group_vars", inventory_dir)
+
+        # The inventory directory is listed again under ./inventories/*, after
+        # ./group_vars, so it keeps that later (higher precedence) position
+        assert [path.resolve() for path in search_dirs] == [
+            (tmp_path / "group_vars").resolve(),
+            (inventory_dir / "group_vars").resolve(),
+        ]
@@ -3,6 +3,7 @@
 import pytest
 
 from said.matcher import (
+    PARALLEL_MATCH_THRESHOLD,
     get_tasks_for_changed_files,
     match_file_to_tasks,
     match_files_to_tasks,
@@ -85,6 +86,55 @@ class TestMatchFileToTasks:
         matched = match_file_to_tasks("some/deep/path/nginx.conf.j2", dep_map)
         assert "task1" in matched
 
+    def test_path_pattern_matches_nested_suffix(self):
+        """Test that a multi-segment pattern matches a trailing part of a deeper path."""
+        task1 = TaskMetadata(
+            name="task1",
+            provides=["resource1"],
+            watch_files=["templates/*.j2"],
+        )
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2"], watch_files=["files/*.j2"]
+        )
+        dep_map = DependencyMap(tasks=[task1, task2])
+
+        matched = match_file_to_tasks("roles/web/templates/nginx.conf.j2", dep_map)
+        assert matched == {"task1"}
+
+    def test_recursive_pattern_matches_any_depth(self):
+        """Test that "**/" matches zero or more directories."""
+        task1 = TaskMetadata(
+            name="task1", provides=["resource1"], watch_files=["roles/**/*.yml"]
+        )
+        dep_map = DependencyMap(tasks=[task1])
+
+        assert match_file_to_tasks("roles/main.yml", dep_map) == {"task1"}
+        assert match_file_to_tasks("roles/web/tasks/main.yml", dep_map) == {"task1"}
+        assert match_file_to_tasks("other/main.yml", dep_map) == set()
+
+    def test_multi_segment_pattern_on_deep_path(self):
+        """Test that a pattern with separators matches a trailing part of a deeper path."""
+        task1 = TaskMetadata(
+            name="task1", provides=["resource1"], watch_files=["roles/*/tasks/*.yml"]
+        )
+        task2 = TaskMetadata(name="task2", provides=["resource2"], watch_files=["web*"])
+        dep_map = DependencyMap(tasks=[task1, task2])
+
+        assert match_file_to_tasks("site/roles/web/tasks/main.yml", dep_map) == {
+            "task1",
+            "task2",
+        }
+        assert match_file_to_tasks("site/tasks/main.yml", dep_map) == set()
+
+    def test_exact_match_with_glob_characters(self):
+        """Test that a path equal to the pattern matches even if it contains glob syntax."""
+        task1 = TaskMetadata(
+            name="task1", provides=["resource1"], watch_files=["files/[prod].yml"]
+        )
+        dep_map = DependencyMap(tasks=[task1])
+
+        assert match_file_to_tasks("files/[prod].yml", dep_map) == {"task1"}
+
 
 class TestMatchFilesToTasks:
     """Test cases for match_files_to_tasks function."""
@@ -125,6 +175,26 @@ class TestMatchFilesToTasks:
         assert len(matched) == 1  # Task should only appear once
 
 
+    def test_match_large_diff_in_parallel(self, monkeypatch):
+        """Test that large diffs matched in a process pool give the serial result."""
+        monkeypatch.setattr("said.matcher.os.cpu_count", lambda: 2)
+        task1 = TaskMetadata(
+            name="task1", provides=["resource1"], watch_files=["*.yml"]
+        )
+        task2 = TaskMetadata(
+            name="task2", provides=["resource2"], watch_files=["docs/*.md"]
+        )
+        task3 = TaskMetadata(
+            name="task3", provides=["resource3"], watch_files=["*.cfg"]
+        )
+        dep_map = DependencyMap(tasks=[task1, task2, task3])
+
+        files = [f"src/file{i}.py" for i in range(PARALLEL_MATCH_THRESHOLD)]
+        files += ["roles/web/tasks/main.yml", "docs/index.md"]
+
+        matched = match_files_to_tasks(files, dep_map)
+        assert matched == {"task1", "task2"}
+
 class TestGetTasksForChangedFiles:
     """Test cases for get_tasks_for_changed_files function."""
 
@@ -71,6 +71,15 @@ class TestAnsibleOrchestrator:
         assert "--tags" in cmd_str
         assert "task1,task2" in cmd_str
 
+    def test_format_command_matches_generate_command_string(self):
+        """Test that formatting a generated command gives the same string."""
+        orchestrator = AnsibleOrchestrator(inventory="hosts file.ini")
+        cmd = orchestrator.generate_command(["role:Install app"], dry_run=True)
+        assert AnsibleOrchestrator.format_command(cmd) == (
+            orchestrator.generate_command_string(["role:Install app"], dry_run=True)
+        )
+        assert "'hosts file.ini'" in AnsibleOrchestrator.format_command(cmd)
+
     def test_format_execution_plan(self):
         """Test execution plan formatting."""
         orchestrator = AnsibleOrchestrator()
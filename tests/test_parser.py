@@ -1,11 +1,13 @@
 """Unit tests for parser module."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from said.parser import (
+    PARALLEL_PARSE_THRESHOLD,
     ParserError,
     clear_dependency_map_cache,
     discover_dependency_map,
@@ -34,6 +36,12 @@ class TestParseYamlFile:
             parse_yaml_file(tmp_path / "nonexistent.yml")
         assert "not found" in str(exc_info.value).lower()
 
+    def test_parse_directory_path(self, tmp_path):
+        """Test parsing a path that is a directory."""
+        with pytest.raises(ParserError) as exc_info:
+            parse_yaml_file(tmp_path)
+        assert "not a file" in str(exc_info.value).lower()
+
     def test_parse_invalid_yaml(self, tmp_path):
         """Test parsing invalid YAML."""
         yaml_file = tmp_path / "invalid.yml"
@@ -248,6 +256,45 @@ class TestParsePlaybookDirectory:
         assert len(result.tasks) == 1
         assert result.get_task_by_name("web_task") is not None
 
+    def test_parse_windows_line_endings(self, tmp_path):
+        """Test parsing playbooks written with CRLF line endings."""
+        playbook = tmp_path / "playbook.yml"
+        playbook.write_bytes(
+            b'---\r\n# SAID: {"name": "task1", "provides": ["resource1"]}\r\n'
+            b"- name: Task 1\r\n"
+        )
+
+        result = parse_playbook_directory(tmp_path)
+        assert result.get_task_by_name("task1") is not None
+
+    def test_parse_memory_mapped_playbooks(self, tmp_path, monkeypatch):
+        """Test that playbooks above the mmap threshold are scanned the same way."""
+        monkeypatch.setattr("said.parser.MMAP_PLAYBOOK_THRESHOLD", 1)
+        (tmp_path / "plain.yml").write_text("- name: No metadata\n")
+        (tmp_path / "tagged.yml").write_text(
+            "- name: Task 1\n"
+            '# SAID: {"name": "task1", "provides": ["resource1"]}\n'
+        )
+
+        result = parse_playbook_directory(tmp_path)
+        assert [task.name for task in result.tasks] == ["task1"]
+
+    def test_parse_large_directory_in_parallel(self, tmp_path, monkeypatch):
+        """Test that large directories parsed in a process pool give the serial result."""
+        monkeypatch.setattr("said.parser.os.cpu_count", lambda: 2)
+        for i in range(PARALLEL_PARSE_THRESHOLD):
+            playbook = tmp_path / f"playbook{i:03d}.yml"
+            playbook.write_text(f'# SAID: {{"name": "task{i}", "provides": ["resource{i}"]}}\n')
+
+        result = parse_playbook_directory(tmp_path)
+        assert len(result.tasks) == PARALLEL_PARSE_THRESHOLD
+        assert result.get_task_by_name("task199") is not None
+
+        (tmp_path / "playbook150.yml").write_text("# SAID: {unclosed\n")
+        with pytest.raises(ParserError) as exc_info:
+            parse_playbook_directory(tmp_path)
+        assert "playbook150.yml" in str(exc_info.value)
+
 
 class TestDiscoverDependencyMap:
     """Test cases for discover_dependency_map function."""
@@ -334,6 +381,28 @@ tasks:
         assert result.get_task_by_name("task1") is not None
         assert result.get_task_by_name("task2") is not None
 
+    def test_discover_searches_each_directory_once(self, tmp_path, monkeypatch):
+        """Test that search paths collapsing onto one directory are searched once."""
+        monkeypatch.chdir(tmp_path)
+        clear_dependency_map_cache()
+        (tmp_path / "dependency_map.yml").write_text(
+            "tasks:\n  - name: task1\n    provides: [resource1]\n"
+        )
+
+        parsed = []
+        original = parse_dependency_map
+
+        def counting_parse(file_path, use_cache=True):
+            parsed.append(file_path)
+            return original(file_path, use_cache)
+
+        monkeypatch.setattr("said.parser.parse_dependency_map", counting_parse)
+
+        # "." and all its parents are the same directory
+        result = discover_dependency_map(".", search_multiple=True)
+        assert result.get_task_by_name("task1") is not None
+        assert len(parsed) == 1
+
 
 class TestDependencyMapCaching:
     """Test cases for dependency map caching."""
@@ -426,3 +495,76 @@ tasks:
         # After clearing, should parse fresh
         result = parse_dependency_map(dep_map_file, use_cache=True)
         assert isinstance(result, DependencyMap)
+
+    def test_cache_invalidated_on_same_mtime_rewrite(self, tmp_path):
+        """Test that a rewrite keeping the mtime is detected by its size."""
+        clear_dependency_map_cache()
+
+        dep_map_file = tmp_path / "dependency_map.yml"
+        dep_map_file.write_text("tasks:\n  - name: task1\n    provides: [resource1]\n")
+        mtime_ns = dep_map_file.stat().st_mtime_ns
+        parse_dependency_map(dep_map_file, use_cache=True)
+
+        dep_map_file.write_text("tasks:\n  - name: task_two\n    provides: [resource2]\n")
+        os.utime(dep_map_file, ns=(mtime_ns, mtime_ns))
+
+        result = parse_dependency_map(dep_map_file, use_cache=True)
+        assert result.get_task_by_name("task_two") is not None
+
+    def test_cache_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        """Test that a full cache evicts the least recently used map."""
+        clear_dependency_map_cache()
+        monkeypatch.setattr("said.parser._DEPENDENCY_MAP_CACHE_SIZE", 2)
+
+        files = []
+        for name in ("a", "b", "c"):
+            dep_map_file = tmp_path / f"{name}.yml"
+            dep_map_file.write_text(f"tasks:\n  - name: {name}\n    provides: [{name}]\n")
+            files.append(dep_map_file)
+
+        result_a = parse_dependency_map(files[0])
+        result_b = parse_dependency_map(files[1])
+        assert parse_dependency_map(files[0]) is result_a
+        parse_dependency_map(files[2])
+
+        assert parse_dependency_map(files[0]) is result_a
+        assert parse_dependency_map(files[1]) is not result_b
+
+    def test_playbook_metadata_cached(self, tmp_path, monkeypatch):
+        """Test that unchanged playbooks are not re-parsed and changed ones are."""
+        clear_dependency_map_cache()
+
+        playbook = tmp_path / "playbook.yml"
+        playbook.write_text('# SAID: {"name": "task1", "provides": ["resource1"]}\n')
+        parse_playbook_directory(tmp_path)
+
+        def fail(file_paths):
+            raise AssertionError("playbook was re-parsed")
+
+        monkeypatch.setattr("said.parser._parse_uncached_playbooks", fail)
+        result = parse_playbook_directory(tmp_path)
+        assert result.get_task_by_name("task1") is not None
+
+        monkeypatch.undo()
+        playbook.write_text('# SAID: {"name": "task2", "provides": ["resource2", "resource3"]}\n')
+        result = parse_playbook_directory(tmp_path)
+        assert result.get_task_by_name("task2") is not None
+        assert result.get_task_by_name("task1") is None
+
+    def test_cached_playbook_metadata_not_shared(self, tmp_path):
+        """Test that mutating a parsed task does not leak into the cache."""
+        clear_dependency_map_cache()
+
+        playbook = tmp_path / "playbook.yml"
+        playbook.write_text(
+            '# SAID: {"name": "task1", "provides": ["resource1"]}\n'
+            '# SAID: {"name": "task2", "provides": ["resource2"], "depends_on": ["resource1"]}\n'
+        )
+        for _ in range(2):
+            result = parse_playbook_directory(tmp_path)
+            result.get_task_by_name("task2").depends_on.append("ghost")
+            result.get_task_by_name("task1").provides.append("extra")
+
+        result = parse_playbook_directory(tmp_path)
+        assert result.get_task_by_name("task2").depends_on == ["resource1"]
+        assert result.get_task_by_name("task1").provides == ["resource1"]
@@ -230,6 +230,25 @@ class TestDependencyMap:
         all_names = dep_map.get_all_task_names()
         assert all_names == {"task1", "task2"}
 
+    def test_task_names_precomputed(self):
+        """Test that task names are frozen once at construction time."""
+        task1 = TaskMetadata(name="task1", provides=["resource1"])
+        task2 = TaskMetadata(name="task2", provides=["resource2"])
+
+        dep_map = DependencyMap(tasks=[task1, task2])
+
+        assert dep_map.task_names == frozenset({"task1", "task2"})
+        assert isinstance(dep_map.task_names, frozenset)
+
+    def test_task_names_without_validation(self):
+        """Test that task names are available on maps built without validation."""
+        dep_map = object.__new__(DependencyMap)
+        dep_map.tasks = [
+            TaskMetadata(name="task1", provides=["resource1"], triggers=["missing"]),
+        ]
+
+        assert dep_map.task_names == frozenset({"task1"})
+
     def test_complex_valid_dependency_map(self):
         """Test a complex but valid dependency map."""
         task1 = TaskMetadata(